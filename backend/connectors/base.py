@@ -1,25 +1,145 @@
 """Base connector class for demand signal sources."""
 from abc import ABC, abstractmethod
+from array import array
+from collections import OrderedDict
 from typing import List, Dict, Any, Optional
 from datetime import datetime
+from enum import Enum
+from concurrent.futures import ThreadPoolExecutor
+import json
 import logging
-import hashlib
+import threading
+import time
+import zlib
+
+try:
+    import orjson  # Optional: faster JSON parse/serialize
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+def json_loads(data: bytes) -> Any:
+    """Parse a JSON payload, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def json_dumps(obj: Any) -> bytes:
+    """Serialize to JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+# Epoch day -> formatted date, so the string is built once per day
+_today_cache: Dict[int, str] = {}
+
+def utc_today(now: Optional[float] = None) -> str:
+    """Return the UTC date of `now` (epoch seconds, default: current time) as YYYY-MM-DD."""
+    day = int((time.time() if now is None else now) // 86400)
+    today = _today_cache.get(day)
+    if today is None:
+        today = datetime.utcfromtimestamp(day * 86400).strftime('%Y-%m-%d')
+        _today_cache.clear()
+        _today_cache[day] = today
+    return today
+
+class TTLCache:
+    """Small thread-safe LRU cache whose entries expire after `ttl` seconds."""
+    
+    def __init__(self, maxsize: int = 256, ttl: float = 900.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+    
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+    
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+    
+    def __len__(self) -> int:
+        return len(self._data)
+
+class TokenBucket:
+    """Thread-safe token bucket refilling at `rate` tokens/sec, capped at `burst`."""
+    
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.last = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def take(self, n: float = 1.0) -> float:
+        """Reserve `n` tokens and return how many seconds to wait before using them."""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+            self.tokens -= n
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+class MetricType(str, Enum):
+    """Known DemandSignal.metric_type values.
+    
+    DemandSignal stores the member's plain string value, so signals from a
+    connector and signals read back from the database look the same."""
+    VOLUME = 'volume'
+    POST_COUNT = 'post_count'
+    STORY_COUNT = 'story_count'
+    VIDEO_COUNT = 'video_count'
+    INTEREST_SCORE = 'interest_score'
+    PEAK_INTEREST = 'peak_interest'
+    GROWTH_RATE = 'growth_rate'
+    TREND_SLOPE = 'trend_slope'
+    ENGAGEMENT = 'engagement'
+    AVG_POINTS = 'avg_points'
+    AVG_UPVOTES = 'avg_upvotes'
+    AVG_VIEWS = 'avg_views'
+    TOTAL_VIEWS = 'total_views'
+    SUBSCRIBER_COUNT = 'subscriber_count'
+
 class DemandSignal:
     """Represents a single demand signal."""
+    __slots__ = ('source', 'query', 'metric_type', 'metric_value', 'metric_unit',
+                 'url', 'timestamp', 'data_date')
+    
     def __init__(self, source: str, query: str, metric_type: str, 
                  metric_value: float, metric_unit: str, url: str,
                  timestamp: Optional[datetime] = None, data_date: Optional[str] = None):
         self.source = source
         self.query = query
-        self.metric_type = metric_type
+        # Plain string, as read back from the database: str()/f-strings of a
+        # MetricType member would give 'MetricType.POST_COUNT'
+        self.metric_type = getattr(metric_type, 'value', metric_type)
         self.metric_value = metric_value
         self.metric_unit = metric_unit
         self.url = url
-        self.timestamp = timestamp or datetime.utcnow()
-        self.data_date = data_date or datetime.utcnow().strftime('%Y-%m-%d')
+        # One clock read serves both defaults, so they can't straddle midnight
+        now = time.time() if timestamp is None or not data_date else None
+        self.timestamp = timestamp or datetime.utcfromtimestamp(now)
+        self.data_date = data_date or utc_today(now)
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -32,13 +152,94 @@ class DemandSignal:
             'timestamp': self.timestamp.isoformat(),
             'data_date': self.data_date
         }
+    
+    def to_json(self) -> bytes:
+        """Serialize to JSON bytes, using orjson when it is installed."""
+        return json_dumps(self.to_dict())
+
+class DemandSignalBatch:
+    """Columnar (struct-of-arrays) container for many demand signals.
+    
+    Keeps one list per field so bulk export touches each column once
+    instead of every attribute of every DemandSignal."""
+    __slots__ = ('sources', 'queries', 'metric_types', 'metric_values',
+                 'metric_units', 'urls', 'timestamps', 'data_dates')
+    
+    def __init__(self):
+        self.sources: List[str] = []
+        self.queries: List[str] = []
+        self.metric_types: List[str] = []
+        self.metric_values = array('d')
+        self.metric_units: List[str] = []
+        self.urls: List[str] = []
+        self.timestamps: List[datetime] = []
+        self.data_dates: List[str] = []
+    
+    @classmethod
+    def from_signals(cls, signals: List[DemandSignal]) -> 'DemandSignalBatch':
+        batch = cls()
+        batch.extend(signals)
+        return batch
+    
+    def __len__(self) -> int:
+        return len(self.metric_values)
+    
+    def append(self, signal: DemandSignal):
+        self.sources.append(signal.source)
+        self.queries.append(signal.query)
+        self.metric_types.append(signal.metric_type)
+        self.metric_values.append(signal.metric_value)
+        self.metric_units.append(signal.metric_unit)
+        self.urls.append(signal.url)
+        self.timestamps.append(signal.timestamp)
+        self.data_dates.append(signal.data_date)
+    
+    def extend(self, signals: List[DemandSignal]):
+        for signal in signals:
+            self.append(signal)
+    
+    def to_dict_of_lists(self) -> Dict[str, list]:
+        """Export as column name -> list of values."""
+        return {
+            'source': list(self.sources),
+            'query': list(self.queries),
+            'metric_type': list(self.metric_types),
+            'metric_value': self.metric_values.tolist(),
+            'metric_unit': list(self.metric_units),
+            'url': list(self.urls),
+            'timestamp': [ts.isoformat() for ts in self.timestamps],
+            'data_date': list(self.data_dates)
+        }
+    
+    def to_frame(self):
+        """Export as a pandas DataFrame (requires pandas)."""
+        import pandas as pd
+        
+        return pd.DataFrame({
+            'source': self.sources,
+            'query': self.queries,
+            'metric_type': self.metric_types,
+            'metric_value': self.metric_values,
+            'metric_unit': self.metric_units,
+            'url': self.urls,
+            'timestamp': self.timestamps,
+            'data_date': self.data_dates
+        })
 
 class BaseConnector(ABC):
     """Abstract base class for demand signal connectors."""
     
+    MAX_CONCURRENT_SEARCHES = 8  # Parallel queries in search_many
+    RATE_LIMIT_BURST = 3  # Calls allowed back-to-back before throttling kicks in
+    MOCK_CACHE_SIZE = 1024  # Memoized mock results kept per connector
+    
     def __init__(self, api_key: Optional[str] = None, mock_mode: bool = False):
         self.api_key = api_key
         self.mock_mode = mock_mode or not api_key
+        self._session = None
+        self._session_lock = threading.Lock()  # search_many/fan_out race to create it
+        self._rate_buckets: Dict[float, TokenBucket] = {}
+        self._mock_cache: Dict[tuple, tuple] = {}  # key -> DemandSignal arg tuples
         self.logger = logging.getLogger(self.__class__.__name__)
         
         if self.mock_mode:
@@ -63,41 +264,133 @@ class BaseConnector(ABC):
         """
         pass
     
+    @property
+    def session(self):
+        """Shared HTTP session with keep-alive, connection pooling and retries.
+        
+        Created on first use so connectors that never hit HTTP don't pay for it."""
+        session = self._session
+        if session is None:
+            with self._session_lock:
+                session = self._session
+                if session is None:
+                    session = self._session = self._build_session()
+        return session
+    
+    @staticmethod
+    def _build_session():
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.request import ACCEPT_ENCODING
+        from urllib3.util.retry import Retry
+        
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.3,
+                              status_forcelist=[429, 500, 502, 503, 504])
+        )
+        session = requests.Session()
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        # ACCEPT_ENCODING only advertises br/zstd when a decoder is installed
+        session.headers.update({
+            'Accept-Encoding': ACCEPT_ENCODING,
+            'User-Agent': 'BusinessSignalAnalyzer/1.0'
+        })
+        return session
+    
+    def close(self):
+        """Close pooled HTTP connections, if a session was ever created."""
+        with self._session_lock:
+            session, self._session = self._session, None
+        if session is not None:
+            session.close()
+    
+    def search_many(self, queries: List[str], **kwargs) -> Dict[str, List[DemandSignal]]:
+        """Search several queries concurrently.
+        
+        Returns:
+            Dict mapping each query to its signals
+        """
+        if not queries:
+            return {}
+        
+        with ThreadPoolExecutor(max_workers=min(len(queries), self.MAX_CONCURRENT_SEARCHES)) as pool:
+            results = pool.map(lambda q: self.search(q, **kwargs), queries)
+            return dict(zip(queries, results))
+    
+    @staticmethod
+    def fan_out(connectors: List['BaseConnector'], query: str,
+                **kwargs) -> Dict[str, List[DemandSignal]]:
+        """Run the same query against several connectors in parallel.
+        
+        A connector that raises contributes an empty list instead of
+        failing the whole batch.
+        
+        Returns:
+            Dict mapping each connector's source_name to its signals
+        """
+        if not connectors:
+            return {}
+        
+        results = {}
+        with ThreadPoolExecutor(max_workers=len(connectors)) as pool:
+            futures = {pool.submit(c.search, query, **kwargs): c for c in connectors}
+            for future, connector in futures.items():
+                try:
+                    results[connector.source_name] = future.result()
+                except Exception as e:
+                    connector.logger.error(f"Error searching {connector.source_name} for '{query}': {e}")
+                    results[connector.source_name] = []
+        return results
+    
     def is_available(self) -> bool:
         """Check if this connector is available (has required keys/config)."""
         return True  # Override in subclasses if needed
     
     def _generate_mock_signals(self, query: str, count: int = 3) -> List[DemandSignal]:
-        """Generate mock signals for testing without API keys."""
-        import random
+        """Generate mock signals for testing without API keys.
         
-        signals = []
-        for i in range(count):
-            # Generate deterministic "random" values based on query
-            query_hash = int(hashlib.md5(f"{query}:{i}".encode()).hexdigest(), 16)
-            value = (query_hash % 1000) + 100
+        Results are memoized per (query, count, day) as tuples of field values;
+        every call gets new signal objects, so callers can't alter the cache."""
+        today = utc_today()
+        key = (query, count, today)
+        cached = self._mock_cache.get(key)
+        if cached is None:
+            timestamp = datetime.utcnow()
+            rows = []
+            for i in range(count):
+                # Generate deterministic "random" values based on query
+                # (CRC32: cheap, stable across processes, no crypto needed here)
+                query_hash = zlib.crc32(f"{query}:{i}".encode())
+                value = (query_hash % 1000) + 100
+                
+                # DemandSignal positional args
+                rows.append((
+                    self.source_name, query, MetricType.VOLUME, float(value), 'mentions',
+                    f'https://example.com/mock/{self.source_name}/{query_hash}',
+                    timestamp, today
+                ))
             
-            signals.append(DemandSignal(
-                source=self.source_name,
-                query=query,
-                metric_type='volume',
-                metric_value=float(value),
-                metric_unit='mentions',
-                url=f'https://example.com/mock/{self.source_name}/{query_hash}',
-                data_date=datetime.utcnow().strftime('%Y-%m-%d')
-            ))
+            cached = tuple(rows)
+            if len(self._mock_cache) >= self.MOCK_CACHE_SIZE:
+                self._mock_cache.clear()
+            self._mock_cache[key] = cached
         
-        return signals
+        return [DemandSignal(*row) for row in cached]
     
     def _respect_rate_limit(self, min_interval: float = 1.0):
-        """Simple rate limiter - sleep if needed."""
-        import time
-        
-        if not hasattr(self, '_last_request_time'):
-            self._last_request_time = 0
+        """Rate limiter - average at most one call per `min_interval` seconds.
         
-        elapsed = time.time() - self._last_request_time
-        if elapsed < min_interval:
-            time.sleep(min_interval - elapsed)
+        Backed by a token bucket, so short bursts go straight through and
+        concurrent callers are handed staggered slots instead of racing."""
+        bucket = self._rate_buckets.get(min_interval)
+        if bucket is None:
+            bucket = self._rate_buckets.setdefault(
+                min_interval, TokenBucket(1.0 / min_interval, self.RATE_LIMIT_BURST)
+            )
         
-        self._last_request_time = time.time()
+        wait = bucket.take()
+        if wait > 0:
+            time.sleep(wait)
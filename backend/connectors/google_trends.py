@@ -1,11 +1,14 @@
 """Google Trends connector for demand signals."""
 from typing import List, Optional
-from datetime import datetime, timedelta
-from .base import BaseConnector, DemandSignal
+from urllib.parse import quote_plus
+from .base import BaseConnector, DemandSignal, MetricType, TTLCache, utc_today
 
 class GoogleTrendsConnector(BaseConnector):
     """Connector for Google Trends data using pytrends."""
     
+    CACHE_TTL = 900  # Seconds to reuse an interest-over-time series
+    RATE_LIMIT_BURST = 1  # Google Trends throttles aggressively; no bursts
+    
     @property
     def source_name(self) -> str:
         return "google_trends"
@@ -13,6 +16,7 @@ class GoogleTrendsConnector(BaseConnector):
     def __init__(self, api_key: Optional[str] = None, mock_mode: bool = False):
         super().__init__(api_key, mock_mode)
         self._pytrends = None
+        self._cache = TTLCache(maxsize=256, ttl=self.CACHE_TTL)
         
         if not self.mock_mode:
             try:
@@ -38,58 +42,68 @@ class GoogleTrendsConnector(BaseConnector):
             return self._generate_mock_signals(query, count=1)
         
         try:
-            self._respect_rate_limit(2.0)  # Google Trends is rate-limited
-            
-            self._pytrends.build_payload([query], cat=0, timeframe=timeframe, geo=geo)
-            data = self._pytrends.interest_over_time()
+            cache_key = (query, geo, timeframe)
+            values = self._cache.get(cache_key)
             
-            if data is None or data.empty:
-                self.logger.warning(f"No trends data for query: {query}")
-                return []
+            if values is None:
+                self._respect_rate_limit(2.0)  # Google Trends is rate-limited
+                
+                self._pytrends.build_payload([query], cat=0, timeframe=timeframe, geo=geo)
+                data = self._pytrends.interest_over_time()
+                
+                if data is None or data.empty:
+                    self.logger.warning(f"No trends data for query: {query}")
+                    return []
+                
+                # Work on the raw ndarray (skips per-call pandas dispatch)
+                values = data[query].to_numpy(dtype=float)
+                self._cache.set(cache_key, values)
             
             # Calculate trend metrics
-            avg_interest = data[query].mean()
-            max_interest = data[query].max()
-            recent_interest = data[query].tail(7).mean()  # Last 7 days
+            half = len(values) // 2
+            max_interest = values.max()
+            recent_interest = values[-7:].mean()  # Last 7 days
             
             # Calculate growth rate
-            first_half = data[query].iloc[:len(data)//2].mean()
-            second_half = data[query].iloc[len(data)//2:].mean()
+            first_half = values[:half].mean() if half else 0.0
+            second_half = values[half:].mean()
             growth_rate = ((second_half - first_half) / first_half * 100) if first_half > 0 else 0
             
+            today = utc_today()
+            explore_url = f'https://trends.google.com/trends/explore?geo={geo}&q={quote_plus(query)}'
             signals = []
             
             # Signal 1: Current volume
             signals.append(DemandSignal(
                 source=self.source_name,
                 query=query,
-                metric_type='interest_score',
+                metric_type=MetricType.INTEREST_SCORE,
                 metric_value=float(recent_interest),
                 metric_unit='relative_0_to_100',
-                url=f'https://trends.google.com/trends/explore?geo={geo}&q={query}',
-                data_date=datetime.utcnow().strftime('%Y-%m-%d')
+                url=explore_url,
+                data_date=today
             ))
             
             # Signal 2: Growth trend
             signals.append(DemandSignal(
                 source=self.source_name,
                 query=query,
-                metric_type='growth_rate',
+                metric_type=MetricType.GROWTH_RATE,
                 metric_value=float(growth_rate),
                 metric_unit='percent_change',
-                url=f'https://trends.google.com/trends/explore?geo={geo}&q={query}',
-                data_date=datetime.utcnow().strftime('%Y-%m-%d')
+                url=explore_url,
+                data_date=today
             ))
             
             # Signal 3: Peak interest
             signals.append(DemandSignal(
                 source=self.source_name,
                 query=query,
-                metric_type='peak_interest',
+                metric_type=MetricType.PEAK_INTEREST,
                 metric_value=float(max_interest),
                 metric_unit='relative_0_to_100',
-                url=f'https://trends.google.com/trends/explore?geo={geo}&q={query}',
-                data_date=datetime.utcnow().strftime('%Y-%m-%d')
+                url=explore_url,
+                data_date=today
             ))
             
             self.logger.info(f"Retrieved {len(signals)} signals for '{query}'")
@@ -1,8 +1,8 @@
 """Hacker News connector for demand signals."""
 from typing import List, Optional
-from datetime import datetime
-import requests
-from .base import BaseConnector, DemandSignal
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote_plus
+from .base import BaseConnector, DemandSignal, MetricType, TTLCache, json_loads, utc_today
 
 class HackerNewsConnector(BaseConnector):
     """Connector for Hacker News using official Firebase API.
@@ -13,6 +13,8 @@ class HackerNewsConnector(BaseConnector):
     
     BASE_URL = "https://hacker-news.firebaseio.com/v0"
     SEARCH_URL = "https://hn.algolia.com/api/v1"  # Algolia search for HN
+    MAX_CONCURRENT_FETCHES = 16  # Parallel item lookups in get_top_stories
+    CACHE_TTL = 900  # Seconds to reuse an Algolia search response
     
     @property
     def source_name(self) -> str:
@@ -21,6 +23,7 @@ class HackerNewsConnector(BaseConnector):
     def __init__(self, api_key: Optional[str] = None, mock_mode: bool = False):
         # HN doesn't need API keys, but we support mock mode for testing
         super().__init__(None, mock_mode)
+        self._cache = TTLCache(maxsize=256, ttl=self.CACHE_TTL)
         self.logger.info("Hacker News connector initialized (no API key needed)")
     
     def search(self, query: str, tags: Optional[List[str]] = None,
@@ -32,25 +35,34 @@ class HackerNewsConnector(BaseConnector):
             return self._generate_mock_signals(query, count=3)
         
         try:
-            self._respect_rate_limit(0.5)  # Be nice to Algolia
-            
-            params = {
-                'query': query,
-                'hitsPerPage': 50,
-                'tags': tags or ['story']
-            }
-            
-            if numericFilters:
-                params['numericFilters'] = numericFilters
-            
-            response = requests.get(
-                f"{self.SEARCH_URL}/search",
-                params=params,
-                timeout=10
-            )
-            response.raise_for_status()
+            cache_key = ('search', query, tuple(tags or ()), numericFilters)
+            data = self._cache.get(cache_key)
+            
+            if data is None:
+                self._respect_rate_limit(0.5)  # Be nice to Algolia
+                
+                params = {
+                    'query': query,
+                    'hitsPerPage': 50,
+                    'tags': tags or ['story'],
+                    # Only ask for what we aggregate; drops titles, text and highlight blobs
+                    'attributesToRetrieve': 'points,num_comments',
+                    'attributesToHighlight': ''
+                }
+                
+                if numericFilters:
+                    params['numericFilters'] = numericFilters
+                
+                response = self.session.get(
+                    f"{self.SEARCH_URL}/search",
+                    params=params,
+                    timeout=10
+                )
+                response.raise_for_status()
+                
+                data = json_loads(response.content)
+                self._cache.set(cache_key, data)
             
-            data = response.json()
             hits = data.get('hits', [])
             
             if not hits:
@@ -59,53 +71,57 @@ class HackerNewsConnector(BaseConnector):
             
             # Calculate metrics
             total_hits = data.get('nbHits', len(hits))
-            total_comments = sum(hit.get('num_comments', 0) for hit in hits)
-            total_points = sum(hit.get('points', 0) for hit in hits)
+            total_comments = 0
+            total_points = 0
+            for hit in hits:
+                total_comments += hit.get('num_comments') or 0
+                total_points += hit.get('points') or 0
             avg_points = total_points / len(hits) if hits else 0
             
             # Get top story URL for citation
             top_story = hits[0] if hits else {}
             top_url = f"https://news.ycombinator.com/item?id={top_story.get('objectID')}"
             
+            today = utc_today()
             signals = []
             
             # Signal 1: Total matching stories
             signals.append(DemandSignal(
                 source=self.source_name,
                 query=query,
-                metric_type='story_count',
+                metric_type=MetricType.STORY_COUNT,
                 metric_value=float(total_hits),
                 metric_unit='stories',
-                url=f'https://hn.algolia.com/?q={query}',
-                data_date=datetime.utcnow().strftime('%Y-%m-%d')
+                url=f'https://hn.algolia.com/?q={quote_plus(query)}',
+                data_date=today
             ))
             
             # Signal 2: Total engagement (comments)
             signals.append(DemandSignal(
                 source=self.source_name,
                 query=query,
-                metric_type='engagement',
+                metric_type=MetricType.ENGAGEMENT,
                 metric_value=float(total_comments),
                 metric_unit='comments',
                 url=top_url,
-                data_date=datetime.utcnow().strftime('%Y-%m-%d')
+                data_date=today
             ))
             
             # Signal 3: Average points (quality)
             signals.append(DemandSignal(
                 source=self.source_name,
                 query=query,
-                metric_type='avg_points',
+                metric_type=MetricType.AVG_POINTS,
                 metric_value=float(avg_points),
                 metric_unit='points',
                 url=top_url,
-                data_date=datetime.utcnow().strftime('%Y-%m-%d')
+                data_date=today
             ))
             
             self.logger.info(f"Found {total_hits} HN stories for '{query}'")
             return signals
             
-        except requests.RequestException as e:
+        except OSError as e:  # requests.RequestException subclasses OSError
             self.logger.error(f"Error searching HN for '{query}': {e}")
             return []
         except Exception as e:
@@ -128,22 +144,17 @@ class HackerNewsConnector(BaseConnector):
             self._respect_rate_limit(0.5)
             
             # Get top story IDs
-            response = requests.get(f"{self.BASE_URL}/topstories.json", timeout=10)
+            response = self.session.get(f"{self.BASE_URL}/topstories.json", timeout=10)
             response.raise_for_status()
             
-            story_ids = response.json()[:limit]
-            stories = []
+            story_ids = json_loads(response.content)[:limit]
             
-            for story_id in story_ids:
-                self._respect_rate_limit(0.1)  # Small delay between requests
-                
-                story_resp = requests.get(
-                    f"{self.BASE_URL}/item/{story_id}.json",
-                    timeout=10
-                )
-                story_resp.raise_for_status()
-                story = story_resp.json()
-                
+            # Item lookups are independent; issue them concurrently
+            with ThreadPoolExecutor(max_workers=self.MAX_CONCURRENT_FETCHES) as pool:
+                items = list(pool.map(self._fetch_item, story_ids))
+            
+            stories = []
+            for story_id, story in zip(story_ids, items):
                 if story and story.get('title'):
                     stories.append({
                         'title': story.get('title'),
@@ -159,6 +170,16 @@ class HackerNewsConnector(BaseConnector):
             self.logger.error(f"Error fetching top stories: {e}")
             return []
     
+    def _fetch_item(self, story_id: int) -> Optional[dict]:
+        """Fetch a single HN item, returning None on failure."""
+        try:
+            resp = self.session.get(f"{self.BASE_URL}/item/{story_id}.json", timeout=10)
+            resp.raise_for_status()
+            return json_loads(resp.content)
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Error fetching HN item {story_id}: {e}")
+            return None
+    
     def search_show_hn(self, query: str) -> List[DemandSignal]:
         """Search Show HN (product launches) for a topic.
         
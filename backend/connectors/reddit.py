@@ -1,11 +1,21 @@
 """Reddit connector for demand signals."""
+import heapq
+import re
+import threading
 from typing import List, Optional
-from datetime import datetime, timedelta
-from .base import BaseConnector, DemandSignal
+from urllib.parse import quote_plus
+from .base import BaseConnector, DemandSignal, MetricType, utc_today
+
+def _compile_keywords(keywords: List[str]) -> re.Pattern:
+    """Build one case-insensitive alternation so each title is scanned once."""
+    return re.compile('|'.join(re.escape(kw) for kw in keywords), re.IGNORECASE)
 
 class RedditConnector(BaseConnector):
     """Connector for Reddit data using official API (PRAW)."""
     
+    PROBLEM_KEYWORDS = ['problem', 'pain', 'struggling', 'difficult', 'frustrated', 'help']
+    _PROBLEM_RE = _compile_keywords(PROBLEM_KEYWORDS)
+    
     @property
     def source_name(self) -> str:
         return "reddit"
@@ -18,7 +28,7 @@ class RedditConnector(BaseConnector):
         self.client_id = client_id
         self.client_secret = client_secret
         self.user_agent = user_agent
-        self._reddit = None
+        self._local = threading.local()  # One praw.Reddit per thread (see client)
         
         if not self.mock_mode:
             if not client_id or not client_secret:
@@ -26,12 +36,7 @@ class RedditConnector(BaseConnector):
                 self.mock_mode = True
             else:
                 try:
-                    import praw
-                    self._reddit = praw.Reddit(
-                        client_id=client_id,
-                        client_secret=client_secret,
-                        user_agent=user_agent
-                    )
+                    self._local.reddit = self._build_client()
                     self.logger.info("Reddit connector initialized")
                 except ImportError:
                     self.logger.warning("praw not installed, switching to mock mode")
@@ -40,6 +45,26 @@ class RedditConnector(BaseConnector):
                     self.logger.error(f"Failed to initialize Reddit: {e}")
                     self.mock_mode = True
     
+    def _build_client(self):
+        import praw
+        return praw.Reddit(
+            client_id=self.client_id,
+            client_secret=self.client_secret,
+            user_agent=self.user_agent
+        )
+    
+    @property
+    def client(self):
+        """This thread's praw.Reddit instance.
+        
+        A praw.Reddit is not thread-safe (its session and rate-limit state are
+        per instance), and search_many, fan_out and the subreddit scraper call
+        this connector from several threads, so each thread gets its own."""
+        reddit = getattr(self._local, 'reddit', None)
+        if reddit is None:
+            reddit = self._local.reddit = self._build_client()
+        return reddit
+    
     def search(self, query: str, subreddits: Optional[List[str]] = None,
                time_filter: str = 'month', limit: int = 100) -> List[DemandSignal]:
         """Search Reddit for posts matching query.
@@ -56,64 +81,64 @@ class RedditConnector(BaseConnector):
         try:
             self._respect_rate_limit(1.0)
             
+            today = utc_today()
+            search_url = f'https://www.reddit.com/search/?q={quote_plus(query)}&sort=new&t={time_filter}'
             signals = []
             total_posts = 0
             total_comments = 0
             total_score = 0
             
             # Search all of Reddit
-            search_results = self._reddit.subreddit('all').search(
+            search_results = self.client.subreddit('all').search(
                 query, 
                 time_filter=time_filter,
                 limit=limit,
                 sort='relevance'
             )
             
-            posts = list(search_results)
-            
-            if not posts:
-                self.logger.warning(f"No Reddit posts found for: {query}")
-                return []
-            
-            for post in posts:
+            # Reduce while iterating; no need to keep the submissions around
+            for post in search_results:
                 total_posts += 1
                 total_comments += post.num_comments
                 total_score += post.score
             
-            avg_score = total_score / len(posts) if posts else 0
-            avg_comments = total_comments / len(posts) if posts else 0
+            if not total_posts:
+                self.logger.warning(f"No Reddit posts found for: {query}")
+                return []
+            
+            avg_score = total_score / total_posts
             
             # Signal 1: Post volume
             signals.append(DemandSignal(
                 source=self.source_name,
                 query=query,
-                metric_type='post_count',
+                metric_type=MetricType.POST_COUNT,
                 metric_value=float(total_posts),
                 metric_unit='posts',
-                url=f'https://www.reddit.com/search/?q={query}&sort=new&t={time_filter}',
-                data_date=datetime.utcnow().strftime('%Y-%m-%d')
+                url=search_url,
+                data_date=today
             ))
             
             # Signal 2: Total engagement (comments)
             signals.append(DemandSignal(
                 source=self.source_name,
                 query=query,
-                metric_type='engagement',
+                metric_type=MetricType.ENGAGEMENT,
                 metric_value=float(total_comments),
                 metric_unit='comments',
-                url=f'https://www.reddit.com/search/?q={query}&sort=new&t={time_filter}',
-                data_date=datetime.utcnow().strftime('%Y-%m-%d')
+                url=search_url,
+                data_date=today
             ))
             
             # Signal 3: Average upvotes (quality indicator)
             signals.append(DemandSignal(
                 source=self.source_name,
                 query=query,
-                metric_type='avg_upvotes',
+                metric_type=MetricType.AVG_UPVOTES,
                 metric_value=float(avg_score),
                 metric_unit='upvotes',
-                url=f'https://www.reddit.com/search/?q={query}&sort=new&t={time_filter}',
-                data_date=datetime.utcnow().strftime('%Y-%m-%d')
+                url=search_url,
+                data_date=today
             ))
             
             self.logger.info(f"Found {total_posts} Reddit posts for '{query}'")
@@ -131,16 +156,16 @@ class RedditConnector(BaseConnector):
         try:
             self._respect_rate_limit(1.0)
             
-            subreddit = self._reddit.subreddit(subreddit_name)
+            subreddit = self.client.subreddit(subreddit_name)
             
             return [DemandSignal(
                 source=self.source_name,
                 query=f"r/{subreddit_name}",
-                metric_type='subscriber_count',
+                metric_type=MetricType.SUBSCRIBER_COUNT,
                 metric_value=float(subreddit.subscribers),
                 metric_unit='subscribers',
                 url=f'https://www.reddit.com/r/{subreddit_name}',
-                data_date=datetime.utcnow().strftime('%Y-%m-%d')
+                data_date=utc_today()
             )]
             
         except Exception as e:
@@ -160,18 +185,19 @@ class RedditConnector(BaseConnector):
                 }
             ]
         
-        if not problem_keywords:
-            problem_keywords = ['problem', 'pain', 'struggling', 'difficult', 'frustrated', 'help']
+        if problem_keywords:
+            problem_re = _compile_keywords(problem_keywords)
+        else:
+            problem_re = self._PROBLEM_RE
         
         try:
             self._respect_rate_limit(1.0)
             
             posts = []
-            sub = self._reddit.subreddit(subreddit)
+            sub = self.client.subreddit(subreddit)
             
             for post in sub.new(limit=100):
-                title_lower = post.title.lower()
-                if any(kw in title_lower for kw in problem_keywords):
+                if problem_re.search(post.title):
                     posts.append({
                         'title': post.title,
                         'url': f'https://www.reddit.com{post.permalink}',
@@ -180,7 +206,7 @@ class RedditConnector(BaseConnector):
                         'created_utc': post.created_utc
                     })
             
-            return sorted(posts, key=lambda x: x['score'], reverse=True)[:20]
+            return heapq.nlargest(20, posts, key=lambda x: x['score'])
             
         except Exception as e:
             self.logger.error(f"Error fetching problem posts: {e}")
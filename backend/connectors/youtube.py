@@ -1,7 +1,7 @@
 """YouTube connector for demand signals."""
-from typing import List, Optional
-from datetime import datetime
-from .base import BaseConnector, DemandSignal
+from typing import Dict, List, Optional
+from urllib.parse import quote_plus
+from .base import BaseConnector, DemandSignal, MetricType, json_loads, utc_today
 
 class YouTubeConnector(BaseConnector):
     """Connector for YouTube Data API.
@@ -36,52 +36,14 @@ class YouTubeConnector(BaseConnector):
             return self._generate_mock_signals(query, count=3)
         
         try:
-            import requests
+            video_ids = self._search_video_ids(query, max_results, order)
             
-            self._respect_rate_limit(0.5)
-            
-            params = {
-                'key': self.api_key,
-                'q': query,
-                'part': 'snippet,statistics',
-                'type': 'video',
-                'maxResults': min(max_results, 50),  # API limit
-                'order': order,
-                'relevanceLanguage': 'en'
-            }
-            
-            response = requests.get(
-                f"{self.BASE_URL}/search",
-                params=params,
-                timeout=10
-            )
-            response.raise_for_status()
-            
-            data = response.json()
-            items = data.get('items', [])
-            
-            if not items:
+            if not video_ids:
                 self.logger.warning(f"No YouTube results for: {query}")
                 return []
             
-            # Get video IDs for statistics
-            video_ids = [item['id']['videoId'] for item in items if 'videoId' in item.get('id', {})]
-            
-            if video_ids:
-                self._respect_rate_limit(0.5)
-                stats_response = requests.get(
-                    f"{self.BASE_URL}/videos",
-                    params={
-                        'key': self.api_key,
-                        'id': ','.join(video_ids[:10]),  # Batch request, limit 10 for simplicity
-                        'part': 'statistics'
-                    },
-                    timeout=10
-                )
-                stats_response.raise_for_status()
-                stats_data = {item['id']: item.get('statistics', {}) for item in stats_response.json().get('items', [])}
-            else:
-                stats_data = {}
+            # The stats lookup needs the IDs, but no extra throttle: quota is per request unit
+            stats_data = self._fetch_video_stats(video_ids)
             
             # Calculate metrics
             total_views = 0
@@ -96,39 +58,41 @@ class YouTubeConnector(BaseConnector):
             
             avg_views = total_views / video_count if video_count else 0
             
+            today = utc_today()
+            results_url = f'https://www.youtube.com/results?search_query={quote_plus(query)}'
             signals = []
             
             # Signal 1: Video volume
             signals.append(DemandSignal(
                 source=self.source_name,
                 query=query,
-                metric_type='video_count',
+                metric_type=MetricType.VIDEO_COUNT,
                 metric_value=float(video_count),
                 metric_unit='videos',
-                url=f'https://www.youtube.com/results?search_query={query}',
-                data_date=datetime.utcnow().strftime('%Y-%m-%d')
+                url=results_url,
+                data_date=today
             ))
             
             # Signal 2: Total views (interest indicator)
             signals.append(DemandSignal(
                 source=self.source_name,
                 query=query,
-                metric_type='total_views',
+                metric_type=MetricType.TOTAL_VIEWS,
                 metric_value=float(total_views),
                 metric_unit='views',
-                url=f'https://www.youtube.com/results?search_query={query}',
-                data_date=datetime.utcnow().strftime('%Y-%m-%d')
+                url=results_url,
+                data_date=today
             ))
             
             # Signal 3: Average views per video (content saturation)
             signals.append(DemandSignal(
                 source=self.source_name,
                 query=query,
-                metric_type='avg_views',
+                metric_type=MetricType.AVG_VIEWS,
                 metric_value=float(avg_views),
                 metric_unit='views_per_video',
-                url=f'https://www.youtube.com/results?search_query={query}',
-                data_date=datetime.utcnow().strftime('%Y-%m-%d')
+                url=results_url,
+                data_date=today
             ))
             
             self.logger.info(f"Found {video_count} YouTube videos for '{query}'")
@@ -138,6 +102,46 @@ class YouTubeConnector(BaseConnector):
             self.logger.error(f"Error searching YouTube for '{query}': {e}")
             return []
     
+    def _search_video_ids(self, query: str, max_results: int, order: str) -> List[str]:
+        """Run a /search call and return the matching video IDs."""
+        self._respect_rate_limit(0.5)
+        
+        params = {
+            'key': self.api_key,
+            'q': query,
+            'part': 'snippet,statistics',
+            'type': 'video',
+            'maxResults': min(max_results, 50),  # API limit
+            'order': order,
+            'relevanceLanguage': 'en',
+            'fields': 'items/id/videoId'  # Partial response: IDs only
+        }
+        
+        response = self.session.get(
+            f"{self.BASE_URL}/search",
+            params=params,
+            timeout=10
+        )
+        response.raise_for_status()
+        
+        items = json_loads(response.content).get('items', [])
+        return [item['id']['videoId'] for item in items if 'videoId' in item.get('id', {})]
+    
+    def _fetch_video_stats(self, video_ids: List[str]) -> Dict[str, dict]:
+        """Fetch statistics for a list of video IDs, keyed by ID."""
+        response = self.session.get(
+            f"{self.BASE_URL}/videos",
+            params={
+                'key': self.api_key,
+                'id': ','.join(video_ids[:50]),  # One request covers up to 50 IDs at the same quota cost
+                'part': 'statistics',
+                'fields': 'items(id,statistics)'
+            },
+            timeout=10
+        )
+        response.raise_for_status()
+        return {item['id']: item.get('statistics', {}) for item in json_loads(response.content).get('items', [])}
+    
     def get_trending_videos(self, category_id: str = '0', 
                            region_code: str = 'US') -> List[dict]:
         """Get trending videos (general trend detection)."""
@@ -151,11 +155,9 @@ class YouTubeConnector(BaseConnector):
             ]
         
         try:
-            import requests
-            
             self._respect_rate_limit(0.5)
             
-            response = requests.get(
+            response = self.session.get(
                 f"{self.BASE_URL}/videos",
                 params={
                     'key': self.api_key,
@@ -163,7 +165,8 @@ class YouTubeConnector(BaseConnector):
                     'chart': 'mostPopular',
                     'regionCode': region_code,
                     'videoCategoryId': category_id,
-                    'maxResults': 25
+                    'maxResults': 25,
+                    'fields': 'items(id,snippet(title,channelTitle),statistics/viewCount)'
                 },
                 timeout=10
             )
@@ -176,7 +179,7 @@ class YouTubeConnector(BaseConnector):
                     'view_count': int(item['statistics'].get('viewCount', 0)),
                     'channel': item['snippet']['channelTitle']
                 }
-                for item in response.json().get('items', [])
+                for item in json_loads(response.content).get('items', [])
             ]
             
         except Exception as e:
@@ -1,14 +1,17 @@
 """Business Signal Analyzer - FastAPI Backend"""
 import os
 import sys
+import asyncio
 import hashlib
 import json
+import re
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from datetime import datetime
 
-from fastapi import FastAPI, HTTPException, File, UploadFile, Form
+from fastapi import FastAPI, HTTPException, File, UploadFile, Form, Request, Response, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
 
@@ -17,13 +20,16 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from storage.database import (
     init_db, create_conversation, get_conversation, list_conversations,
-    create_message, get_messages_by_conversation,
+    create_messages_bulk, get_messages_by_conversation,
     create_topic, get_topics_by_conversation, update_topic_message_count,
     create_pain_point, get_pain_points_by_topic,
-    create_demand_signal, get_demand_signals_by_topic, get_demand_signals_stats,
-    create_business_idea, get_business_ideas, update_idea_score,
-    create_evidence_link, get_evidence_by_idea
+    create_demand_signals_bulk, get_demand_signals_by_topic,
+    get_demand_signals_by_topics, get_demand_signals_stats, get_demand_signals_version,
+    create_business_idea, create_business_ideas_bulk, get_business_ideas, get_idea_by_id,
+    update_idea_score, update_idea_scores_bulk,
+    create_evidence_link, get_evidence_by_idea, transaction
 )
+from connectors.base import TTLCache, json_dumps, orjson
 from connectors.google_trends import GoogleTrendsConnector
 from connectors.reddit import RedditConnector
 from connectors.hackernews import HackerNewsConnector
@@ -32,12 +38,17 @@ from scoring.engine import ScoringEngine
 from pipeline.reddit_scraper import RedditAutoScraper
 
 # Initialize
-app = FastAPI(title="Business Signal Analyzer", version="1.0.0")
+class JSONBytesResponse(JSONResponse):
+    """JSONResponse rendered through json_dumps (orjson when installed)."""
+    def render(self, content) -> bytes:
+        return json_dumps(content)
+
+app = FastAPI(title="Business Signal Analyzer", version="1.0.0",
+              default_response_class=JSONBytesResponse if orjson else JSONResponse)
 
 # Global exception handler to ensure JSON responses
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
-    from fastapi.responses import JSONResponse
     return JSONResponse(
         status_code=500,
         content={"detail": str(exc), "type": "internal_error"}
@@ -69,11 +80,47 @@ gtrends = GoogleTrendsConnector(mock_mode=True)
 reddit = RedditConnector(mock_mode=True)
 hn = HackerNewsConnector()
 youtube = YouTubeConnector(mock_mode=True)
+connectors = (gtrends, reddit, hn, youtube)
+MAX_CONCURRENT_SEARCHES = 16  # In-flight connector searches per collect request
+
+@app.on_event("shutdown")
+async def shutdown():
+    for connector in connectors:
+        connector.close()
+
+# Encoded /api/demand/topic bodies keyed by ETag (stale entries just stop being hit)
+demand_response_cache = TTLCache(maxsize=1024, ttl=3600)
 
 # Initialize scoring engine
 weights_path = Path(__file__).parent / "scoring" / "weights.yaml"
 scorer = ScoringEngine(weights_path)
 
+def text_sha256(text: str) -> str:
+    """SHA-256 hex digest of text, used to dedupe conversations.
+    
+    hashlib.sha256 is OpenSSL's implementation (SHA-NI where the CPU has it)
+    and releases the GIL for large buffers, so one update over the encoded
+    bytes is already the fast path."""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+# Speaker prefix: up to 29 non-colon chars before the first colon
+SPEAKER_RE = re.compile(r'([^:]{0,29}):(.*)')
+
+
+def parse_message_lines(text: str) -> List[Tuple[str, Optional[str]]]:
+    """Split pasted text into (message_text, speaker) rows."""
+    rows = []
+    for line in text.strip().split('\n'):
+        line = line.strip()
+        if line:
+            # Try to detect speaker: a short "Name:" prefix
+            match = SPEAKER_RE.match(line)
+            if match:
+                rows.append((match.group(2).strip(), match.group(1).strip()))
+            else:
+                rows.append((line, None))
+    return rows
+
 # Pydantic models
 class ConversationCreate(BaseModel):
     text: str
@@ -86,6 +133,15 @@ class TopicResponse(BaseModel):
     message_count: int
     keywords: List[str]
 
+class TopicCreate(BaseModel):
+    conversation_id: int
+    name: str
+    description: str = ""
+    keywords: List[str] = []
+
+class TopicBatchCreate(BaseModel):
+    topics: List[TopicCreate]
+
 class BusinessIdeaCreate(BaseModel):
     topic_id: int
     title: str
@@ -98,6 +154,9 @@ class BusinessIdeaCreate(BaseModel):
     ops_burden_estimate: str = "medium"
     compliance_risks: Optional[str] = None
 
+class BusinessIdeaBatchCreate(BaseModel):
+    ideas: List[BusinessIdeaCreate]
+
 class ScoreWeights(BaseModel):
     demand_strength: float = 0.25
     demand_velocity: float = 0.20
@@ -152,31 +211,25 @@ async def health():
 @app.post("/api/conversations")
 async def create_conversation_endpoint(data: ConversationCreate):
     """Create a new conversation from text."""
-    # Generate hash of text
-    text_hash = hashlib.sha256(data.text.encode()).hexdigest()
+    # Hash the text and extract messages (split by newlines or speakers) in
+    # worker threads so large pastes don't block the event loop; sha256
+    # releases the GIL, so the two overlap
+    loop = asyncio.get_running_loop()
+    text_hash, rows = await asyncio.gather(
+        loop.run_in_executor(None, text_sha256, data.text),
+        loop.run_in_executor(None, parse_message_lines, data.text)
+    )
     summary = data.text[:500]
     
     try:
-        conv_id = create_conversation(data.source_type, text_hash, summary)
-        
-        # Simple message extraction (split by newlines or speakers)
-        lines = data.text.strip().split('\n')
-        for line in lines:
-            line = line.strip()
-            if line:
-                # Try to detect speaker (simple heuristic)
-                speaker = None
-                if ':' in line[:50]:
-                    parts = line.split(':', 1)
-                    if len(parts) == 2 and len(parts[0]) < 30:
-                        speaker = parts[0].strip()
-                        line = parts[1].strip()
-                
-                create_message(conv_id, line, speaker)
+        with transaction():
+            conv_id = create_conversation(data.source_type, text_hash, summary)
+            create_messages_bulk(conv_id, rows)
         
         return {
             "id": conv_id,
-            "message_count": len(lines),
+            # Raw line count (blank lines included), as the API has always reported
+            "message_count": data.text.strip().count('\n') + 1,
             "status": "created"
         }
         
@@ -217,6 +270,19 @@ async def create_topic_endpoint(
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/api/topics/batch")
+async def create_topics_batch_endpoint(batch: TopicBatchCreate):
+    """Create several topic clusters in one transaction."""
+    try:
+        with transaction():
+            topic_ids = [
+                create_topic(t.conversation_id, t.name, t.description, t.keywords)
+                for t in batch.topics
+            ]
+        return {"ids": topic_ids, "status": "created"}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 @app.get("/api/topics")
 async def list_topics_endpoint(conversation_id: Optional[int] = None):
     """List topics, optionally filtered by conversation."""
@@ -237,61 +303,64 @@ async def list_topics_endpoint(conversation_id: Optional[int] = None):
 @app.post("/api/demand/collect")
 async def collect_demand_signals(topic_id: int, queries: List[str]):
     """Collect demand signals for a topic across all sources."""
-    signals_collected = []
+    loop = asyncio.get_running_loop()
+    limit = asyncio.Semaphore(MAX_CONCURRENT_SEARCHES)
     
-    for query in queries:
-        # Google Trends
-        for signal in gtrends.search(query):
-            sid = create_demand_signal(
-                topic_id, signal.source, signal.query,
-                signal.metric_type, signal.metric_value,
-                signal.metric_unit, signal.url
-            )
-            signals_collected.append({"id": sid, "source": signal.source})
-        
-        # Reddit
-        for signal in reddit.search(query):
-            sid = create_demand_signal(
-                topic_id, signal.source, signal.query,
-                signal.metric_type, signal.metric_value,
-                signal.metric_unit, signal.url
-            )
-            signals_collected.append({"id": sid, "source": signal.source})
-        
-        # Hacker News
-        for signal in hn.search(query):
-            sid = create_demand_signal(
-                topic_id, signal.source, signal.query,
-                signal.metric_type, signal.metric_value,
-                signal.metric_unit, signal.url
-            )
-            signals_collected.append({"id": sid, "source": signal.source})
-        
-        # YouTube
-        for signal in youtube.search(query):
-            sid = create_demand_signal(
-                topic_id, signal.source, signal.query,
-                signal.metric_type, signal.metric_value,
-                signal.metric_unit, signal.url
+    async def search(connector, query):
+        async with limit:
+            return await loop.run_in_executor(None, connector.search, query)
+    
+    # Every (query, source) pair is independent blocking I/O; run them concurrently
+    pairs = [(connector, query) for query in queries for connector in connectors]
+    results = await asyncio.gather(
+        *(search(connector, query) for connector, query in pairs),
+        return_exceptions=True
+    )
+    
+    signals = []
+    for (connector, query), result in zip(pairs, results):
+        if isinstance(result, BaseException):
+            connector.logger.error(
+                f"Error searching {connector.source_name} for '{query}': {result}",
+                exc_info=result
             )
-            signals_collected.append({"id": sid, "source": signal.source})
+            continue
+        signals.extend(result)
+    
+    create_demand_signals_bulk(topic_id, [
+        (s.source, s.query, s.metric_type, s.metric_value, s.metric_unit, s.url)
+        for s in signals
+    ])
     
     return {
         "topic_id": topic_id,
-        "signals_collected": len(signals_collected),
-        "sources": list(set(s["source"] for s in signals_collected))
+        "signals_collected": len(signals),
+        "sources": list(dict.fromkeys(s.source for s in signals))
     }
 
 @app.get("/api/demand/topic/{topic_id}")
-async def get_demand_for_topic(topic_id: int):
-    """Get all demand signals for a topic."""
-    signals = get_demand_signals_by_topic(topic_id)
-    stats = get_demand_signals_stats(topic_id)
+async def get_demand_for_topic(topic_id: int, request: Request):
+    """Get all demand signals for a topic.
     
-    return {
-        "signals": signals,
-        "stats": stats
-    }
+    Responses carry an ETag tied to the topic's signal rows; unchanged topics
+    are answered with 304 or from an in-memory cache of the encoded body."""
+    etag = f'"{topic_id}-{get_demand_signals_version(topic_id)}"'
+    headers = {"ETag": etag}
+    
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    
+    body = demand_response_cache.get(etag)
+    if body is None:
+        signals = get_demand_signals_by_topic(topic_id)
+        stats = get_demand_signals_stats(topic_id)
+        body = json_dumps({
+            "signals": signals,
+            "stats": stats
+        })
+        demand_response_cache.set(etag, body)
+    
+    return Response(content=body, media_type="application/json", headers=headers)
 
 # Business idea endpoints
 @app.post("/api/ideas")
@@ -314,6 +383,15 @@ async def create_idea_endpoint(idea: BusinessIdeaCreate):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/api/ideas/batch")
+async def create_ideas_batch_endpoint(batch: BusinessIdeaBatchCreate):
+    """Create several business ideas in one transaction."""
+    try:
+        idea_ids = create_business_ideas_bulk([idea.model_dump() for idea in batch.ideas])
+        return {"ids": idea_ids, "status": "created"}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 @app.get("/api/ideas")
 async def list_ideas_endpoint(topic_id: Optional[int] = None, min_score: float = 0.0):
     """List business ideas with scores."""
@@ -323,8 +401,7 @@ async def list_ideas_endpoint(topic_id: Optional[int] = None, min_score: float =
 async def score_idea_endpoint(idea_id: int):
     """Recalculate score for a business idea."""
     # Get idea
-    ideas = get_business_ideas(min_score=0.0)
-    idea = next((i for i in ideas if i['id'] == idea_id), None)
+    idea = get_idea_by_id(idea_id)
     
     if not idea:
         raise HTTPException(status_code=404, detail="Idea not found")
@@ -336,7 +413,7 @@ async def score_idea_endpoint(idea_id: int):
     breakdown = scorer.score_idea(idea, signals)
     
     # Update database
-    update_idea_score(idea_id, breakdown.total, json.dumps(breakdown.to_dict()))
+    update_idea_score(idea_id, breakdown.total, breakdown.to_dict())
     
     return breakdown.to_dict()
 
@@ -346,21 +423,17 @@ async def rank_ideas_endpoint(topic_id: int):
     # Get all ideas for topic
     ideas = get_business_ideas(topic_id, min_score=0.0)
     
-    # Pair with signals and rank
-    ideas_with_signals = []
-    for idea in ideas:
-        signals = get_demand_signals_by_topic(idea['topic_id'])
-        ideas_with_signals.append((idea, signals))
+    # Pair with signals (one query for all topics) and rank
+    signals_by_topic = get_demand_signals_by_topics([idea['topic_id'] for idea in ideas])
+    ideas_with_signals = [(idea, signals_by_topic[idea['topic_id']]) for idea in ideas]
     
     ranked = scorer.rank_ideas(ideas_with_signals)
     
     # Update ranks in database
-    for idea in ranked:
-        update_idea_score(
-            idea['id'], 
-            idea['total_score'], 
-            json.dumps(idea['score_breakdown'])
-        )
+    update_idea_scores_bulk([
+        (idea['id'], idea['total_score'], idea['score_breakdown'])
+        for idea in ranked
+    ])
     
     return ranked
 
@@ -395,32 +468,19 @@ async def get_scoring_weights():
     return scorer.get_weights_config()
 
 @app.post("/api/scoring/weights")
-async def update_scoring_weights(weights: ScoreWeights):
-    """Update scoring weights (creates new engine instance)."""
-    global scorer
-    
-    new_weights = {
+async def update_scoring_weights(weights: ScoreWeights, background_tasks: BackgroundTasks):
+    """Update scoring weights in place and persist them in the background."""
+    new_weights = scorer.set_weights({
         'demand_strength': weights.demand_strength,
         'demand_velocity': weights.demand_velocity,
         'competition_proxy': weights.competition_proxy,
         'feasibility': weights.feasibility,
         'automation_friendly': weights.automation_friendly,
         'monetization_clarity': weights.monetization_clarity
-    }
-    
-    # Validate weights sum to ~1.0
-    total = sum(new_weights.values())
-    if abs(total - 1.0) > 0.01:
-        # Normalize
-        new_weights = {k: v/total for k, v in new_weights.items()}
-    
-    # Update weights file
-    weights_path = Path(__file__).parent / "scoring" / "weights.yaml"
-    with open(weights_path, 'w') as f:
-        yaml.dump({'weights': new_weights}, f)
+    })
     
-    # Recreate scorer with new weights
-    scorer = ScoringEngine(weights_path)
+    # Write weights.yaml after the response is sent
+    background_tasks.add_task(scorer.save_weights, weights_path)
     
     return {"status": "updated", "weights": new_weights}
 
@@ -464,24 +524,28 @@ async def scrape_reddit(request: RedditScrapeRequest):
     
     # Create in database
     try:
-        text_hash = hashlib.sha256(conversation_text.encode()).hexdigest()
-        conv_id = create_conversation("reddit_auto_scrape", text_hash, conversation_text[:500])
+        text_hash = text_sha256(conversation_text)
         
-        # Add messages
-        for p in posts[:15]:
-            msg_text = f"[{p['subreddit']}] {p['title']}\n{p['text'][:400]}"
-            create_message(conv_id, msg_text, speaker=f"reddit_user_{p['author']}")
-        
-        # Create topics in DB
-        topic_ids = []
-        for topic in topics[:5]:  # Top 5 topics
-            topic_id = create_topic(
-                conv_id,
-                topic['name'],
-                topic['description'],
-                topic['keywords']
-            )
-            topic_ids.append(topic_id)
+        # Conversation, messages and topics land in one commit
+        with transaction():
+            conv_id = create_conversation("reddit_auto_scrape", text_hash, conversation_text[:500])
+            
+            # Add messages
+            create_messages_bulk(conv_id, [
+                (f"[{p['subreddit']}] {p['title']}\n{p['text'][:400]}", f"reddit_user_{p['author']}")
+                for p in posts[:15]
+            ])
+            
+            # Create topics in DB
+            topic_ids = []
+            for topic in topics[:5]:  # Top 5 topics
+                topic_id = create_topic(
+                    conv_id,
+                    topic['name'],
+                    topic['description'],
+                    topic['keywords']
+                )
+                topic_ids.append(topic_id)
         
         return {
             "status": "success",
@@ -489,7 +553,7 @@ async def scrape_reddit(request: RedditScrapeRequest):
             "posts_found": len(posts),
             "topics_created": len(topic_ids),
             "topic_ids": topic_ids,
-            "subreddits": list(set(p['subreddit'] for p in posts)),
+            "subreddits": list(dict.fromkeys(p['subreddit'] for p in posts)),
             "next_step": f"Visit /topics.html?conv={conv_id} to view topics and collect demand signals"
         }
         
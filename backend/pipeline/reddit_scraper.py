@@ -3,6 +3,9 @@ import sys
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import heapq
 import re
 
 # Add backend to path for imports
@@ -10,6 +13,33 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from connectors.reddit import RedditConnector
 
+def _keyword_pattern(keywords) -> re.Pattern:
+    """Compile keywords into one pattern whose findall() returns every keyword hit.
+    
+    The lookahead makes matches zero-width, so overlapping keywords are all
+    reported from a single scan of the text."""
+    alternation = '|'.join(re.escape(kw) for kw in sorted(keywords, key=len, reverse=True))
+    return re.compile(f'(?=({alternation}))')
+
+@lru_cache(maxsize=4096)
+def _search_queries(name: str, titles: tuple) -> tuple:
+    """Build deduplicated search queries for a lowercased topic name and post titles."""
+    queries = [
+        f"{name} software",
+        f"{name} tool",
+        f"best {name}",
+        f"{name} for small business",
+    ]
+    
+    # Extract additional queries from post titles
+    for title in titles:
+        # Simple noun phrase extraction
+        words = title.lower().split()[:4]
+        if len(words) >= 2:
+            queries.append(' '.join(words))
+    
+    return tuple(dict.fromkeys(queries))[:10]  # Deduplicate in order, limit to 10
+
 class RedditAutoScraper:
     """Auto-scrape Reddit for business pain points and signals."""
     
@@ -25,6 +55,8 @@ class RedditAutoScraper:
         'marketing'
     ]
     
+    MAX_CONCURRENT_SUBREDDITS = 8  # Parallel listing fetches in find_pain_posts
+    
     # Pain point indicators
     PAIN_KEYWORDS = [
         'problem', 'pain', 'struggle', 'frustrated', 'annoying',
@@ -33,6 +65,21 @@ class RedditAutoScraper:
         'help with', 'advice on', 'how do you', 'best way to'
     ]
     
+    # Simple keyword-based topic clustering
+    TOPIC_KEYWORDS = {
+        'compliance': ['compliance', 'regulation', 'legal', 'documentation', 'audit'],
+        'payments': ['payment', 'invoice', 'billing', 'charge', 'fee'],
+        'marketing': ['marketing', 'leads', 'customers', 'acquisition', 'growth'],
+        'operations': ['operations', 'workflow', 'process', 'automation', 'efficiency'],
+        'software': ['software', 'tool', 'app', 'platform', 'SaaS'],
+        'hiring': ['hire', 'employee', 'team', 'contractor', 'freelancer'],
+        'communication': ['email', 'slack', 'communication', 'meeting', 'client']
+    }
+    
+    _PAIN_RE = _keyword_pattern(PAIN_KEYWORDS)
+    _TOPIC_BY_KEYWORD = {kw: name for name, kws in TOPIC_KEYWORDS.items() for kw in kws}
+    _TOPIC_RE = _keyword_pattern(_TOPIC_BY_KEYWORD)
+    
     def __init__(self, reddit_connector: Optional[RedditConnector] = None):
         self.reddit = reddit_connector or RedditConnector(mock_mode=True)
     
@@ -49,77 +96,93 @@ class RedditAutoScraper:
         subreddits = subreddits or self.DEFAULT_SUBREDDITS
         pain_posts = []
         
-        for subreddit in subreddits:
-            if self.reddit.mock_mode:
-                # Generate mock data
+        if self.reddit.mock_mode:
+            # Generate mock data
+            for subreddit in subreddits:
                 pain_posts.extend(self._generate_mock_posts(subreddit, 3))
-                continue
+        else:
+            # Each subreddit listing is independent network I/O; fetch them in
+            # parallel (each worker thread gets its own praw client, see
+            # RedditConnector.client)
+            with ThreadPoolExecutor(max_workers=min(len(subreddits), self.MAX_CONCURRENT_SUBREDDITS)) as pool:
+                for posts in pool.map(lambda sr: self._scrape_one(sr, limit), subreddits):
+                    pain_posts.extend(posts)
+        
+        # Top 100 by engagement (score + comments)
+        return heapq.nlargest(
+            100, pain_posts,
+            key=lambda x: x['score'] + x['num_comments'] * 2
+        )
+    
+    def _scrape_one(self, subreddit: str, limit: int) -> List[Dict[str, Any]]:
+        """Collect pain posts from one subreddit's newest posts."""
+        pain_posts = []
+        try:
+            posts = self.reddit.client.subreddit(subreddit).new(limit=limit)
+            
+            # Hoist attribute lookups out of the per-post loop
+            append = pain_posts.append
+            find_pain = self._PAIN_RE.findall
+            pain_keywords = self.PAIN_KEYWORDS
             
-            try:
-                posts = self.reddit._reddit.subreddit(subreddit).new(limit=limit)
+            for post in posts:
+                title = post.title
                 
-                for post in posts:
-                    title_lower = post.title.lower()
+                # Check if post contains pain keywords (one regex pass)
+                found = set(find_pain(title.lower()))
+                if found:
+                    append({
+                        'title': title,
+                        'text': post.selftext[:500],
+                        'url': f'https://www.reddit.com{post.permalink}',
+                        'subreddit': subreddit,
+                        'score': post.score,
+                        'num_comments': post.num_comments,
+                        'created_utc': post.created_utc,
+                        'author': str(post.author) if post.author else 'deleted',
+                        'pain_signals': [kw for kw in pain_keywords if kw in found]
+                    })
                     
-                    # Check if post contains pain keywords
-                    if any(kw in title_lower for kw in self.PAIN_KEYWORDS):
-                        pain_posts.append({
-                            'title': post.title,
-                            'text': post.selftext[:500],
-                            'url': f'https://www.reddit.com{post.permalink}',
-                            'subreddit': subreddit,
-                            'score': post.score,
-                            'num_comments': post.num_comments,
-                            'created_utc': post.created_utc,
-                            'author': str(post.author) if post.author else 'deleted',
-                            'pain_signals': [kw for kw in self.PAIN_KEYWORDS if kw in title_lower]
-                        })
-                        
-            except Exception as e:
-                print(f"Error scraping r/{subreddit}: {e}")
-                continue
+        except Exception as e:
+            print(f"Error scraping r/{subreddit}: {e}")
         
-        # Sort by engagement (score + comments)
-        pain_posts.sort(
-            key=lambda x: x['score'] + x['num_comments'] * 2,
-            reverse=True
-        )
-        
-        return pain_posts[:100]  # Return top 100
+        return pain_posts
     
     def extract_topics(self, posts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Extract topic clusters from pain posts."""
-        # Simple keyword-based clustering
-        topic_keywords = {
-            'compliance': ['compliance', 'regulation', 'legal', 'documentation', 'audit'],
-            'payments': ['payment', 'invoice', 'billing', 'charge', 'fee'],
-            'marketing': ['marketing', 'leads', 'customers', 'acquisition', 'growth'],
-            'operations': ['operations', 'workflow', 'process', 'automation', 'efficiency'],
-            'software': ['software', 'tool', 'app', 'platform', 'SaaS'],
-            'hiring': ['hire', 'employee', 'team', 'contractor', 'freelancer'],
-            'communication': ['email', 'slack', 'communication', 'meeting', 'client']
-        }
-        
-        topics = {name: [] for name in topic_keywords}
+        # Simple keyword-based clustering; counts and engagement are
+        # accumulated in the same pass, and only the first 5 posts are kept
+        topic_keywords = self.TOPIC_KEYWORDS
+        top_posts = {name: [] for name in topic_keywords}
+        post_counts = dict.fromkeys(topic_keywords, 0)
+        engagement = dict.fromkeys(topic_keywords, 0)
         
         for post in posts:
             text = f"{post['title']} {post['text']}".lower()
             
-            for topic_name, keywords in topic_keywords.items():
-                if any(kw in text for kw in keywords):
-                    topics[topic_name].append(post)
+            # One regex pass finds every keyword; map them back to their topics
+            matched = {self._TOPIC_BY_KEYWORD[kw] for kw in self._TOPIC_RE.findall(text)}
+            if not matched:
+                continue
+            
+            post_engagement = post['score'] + post['num_comments']
+            for topic_name in matched:
+                post_counts[topic_name] += 1
+                engagement[topic_name] += post_engagement
+                if len(top_posts[topic_name]) < 5:
+                    top_posts[topic_name].append(post)
         
         # Create topic summaries
         topic_summaries = []
-        for topic_name, posts in topics.items():
-            if posts:
+        for topic_name, count in post_counts.items():
+            if count:
                 topic_summaries.append({
                     'name': topic_name.title(),
                     'description': f'Posts about {topic_name} challenges and solutions',
-                    'post_count': len(posts),
-                    'posts': posts[:5],  # Top 5 posts
+                    'post_count': count,
+                    'posts': top_posts[topic_name],  # Top 5 posts
                     'keywords': topic_keywords[topic_name],
-                    'total_engagement': sum(p['score'] + p['num_comments'] for p in posts)
+                    'total_engagement': engagement[topic_name]
                 })
         
         # Sort by engagement
@@ -129,22 +192,8 @@ class RedditAutoScraper:
     
     def generate_search_queries(self, topic: Dict[str, Any]) -> List[str]:
         """Generate search queries for demand signal collection."""
-        queries = []
-        
-        # Base queries from topic name
-        queries.append(f"{topic['name'].lower()} software")
-        queries.append(f"{topic['name'].lower()} tool")
-        queries.append(f"best {topic['name'].lower()}")
-        queries.append(f"{topic['name'].lower()} for small business")
-        
-        # Extract additional queries from post titles
-        for post in topic['posts'][:3]:
-            # Simple noun phrase extraction
-            words = post['title'].lower().split()[:4]
-            if len(words) >= 2:
-                queries.append(' '.join(words))
-        
-        return list(set(queries))[:10]  # Deduplicate, limit to 10
+        titles = tuple(post['title'] for post in topic['posts'][:3])
+        return list(_search_queries(topic['name'].lower(), titles))
     
     def _generate_mock_posts(self, subreddit: str, count: int = 3) -> List[Dict[str, Any]]:
         """Generate mock posts for testing."""
@@ -211,5 +260,5 @@ class RedditAutoScraper:
             'topics_extracted': len(topics),
             'conversation_text': conversation_text,
             'topics': topics,
-            'top_subreddits': list(set(p['subreddit'] for p in posts[:20]))
+            'top_subreddits': list(dict.fromkeys(p['subreddit'] for p in posts[:20]))
         }
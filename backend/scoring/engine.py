@@ -1,12 +1,74 @@
 """Scoring engine for business ideas."""
 import yaml
-import json
+import math
+import os
+import re
+import threading
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
+from datetime import datetime, timedelta
+from functools import lru_cache
+from operator import itemgetter
+
+# metric_type buckets (values of connectors.base.MetricType); sets make each
+# per-signal membership test a single hash lookup
+VOLUME_METRIC_TYPES = frozenset({'volume', 'post_count', 'story_count', 'video_count', 'interest_score'})
+GROWTH_METRIC_TYPES = frozenset({'growth_rate', 'trend_slope'})
+
+# metric_type -> bucket code, so each signal is classified with one lookup
+_VOLUME, _GROWTH = 1, 2
+_METRIC_BUCKET = {
+    **dict.fromkeys(VOLUME_METRIC_TYPES, _VOLUME),
+    **dict.fromkeys(GROWTH_METRIC_TYPES, _GROWTH)
+}
+
+# summarize_signals([]): every signal component falls back to its default
+_EMPTY_SUMMARY = {
+    'signal_count': 0,
+    'avg_volume': None,
+    'avg_growth': None,
+    'has_recent': False,
+    'show_hn_count': 0
+}
+
+def _clamp100(value: float) -> float:
+    """Clamp a component score to the 0-100 scale."""
+    return 0.0 if value < 0.0 else (100.0 if value > 100.0 else value)
+
+# Canonical signal dates compare correctly as strings, no parsing needed
+_ISO_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+
+@lru_cache(maxsize=1024)
+def _parse_date(date_str: str) -> Optional[datetime]:
+    """Parse a YYYY-MM-DD signal date; signals share a handful of distinct dates."""
+    try:
+        return datetime.strptime(date_str, '%Y-%m-%d')
+    except (TypeError, ValueError):
+        return None
+
+# C-backed loader/dumper when PyYAML was built against libyaml
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+@lru_cache(maxsize=32)
+def _read_weights_file(path: str, mtime_ns: int) -> Optional[Dict[str, float]]:
+    """Parse a weights file; keyed on mtime so an edited file is re-read."""
+    with open(path, 'r') as f:
+        config = yaml.load(f, Loader=_YAML_LOADER)
+    return config.get('weights')
+
+# Component order shared by ScoreBreakdown and the cached weight tuple
+COMPONENTS = ('demand_strength', 'demand_velocity', 'competition_proxy',
+              'feasibility', 'automation_friendly', 'monetization_clarity')
 
 @dataclass
 class ScoreBreakdown:
+    # Declared by hand (not slots=True) so older Pythons keep working;
+    # rank_ideas builds one per idea, so skipping __dict__ adds up. Not
+    # frozen: that routes every field through object.__setattr__ in __init__
+    __slots__ = COMPONENTS + ('total',)
+    
     demand_strength: float
     demand_velocity: float
     competition_proxy: float
@@ -16,6 +78,7 @@ class ScoreBreakdown:
     total: float
     
     def to_dict(self) -> Dict[str, float]:
+        # Spelled out: beats looping over __slots__ with getattr
         return {
             'demand_strength': round(self.demand_strength, 2),
             'demand_velocity': round(self.demand_velocity, 2),
@@ -38,87 +101,176 @@ class ScoringEngine:
         'monetization_clarity': 0.10
     }
     
+    # ops_burden_estimate -> component score (built once, not per call)
+    _FEASIBILITY_BY_BURDEN = {'low': 85.0, 'medium': 65.0, 'high': 40.0}
+    _AUTOMATION_BY_BURDEN = {'low': 90.0, 'medium': 60.0, 'high': 30.0}  # Low burden = more automatable
+    
+    COMPONENTS = COMPONENTS
+    
+    _save_lock = threading.Lock()  # Serializes save_weights writers
+    _default_normalized: Optional[Dict[str, float]] = None  # Filled on first use
+    
     def __init__(self, weights_path: Optional[Path] = None):
         self.weights = self._load_weights(weights_path)
         self._validate_weights()
     
+    @classmethod
+    def from_weights(cls, weights: Dict[str, float]) -> 'ScoringEngine':
+        """Build an engine from an in-memory weights dict (normalized like a file's)."""
+        engine = cls()
+        engine.set_weights(weights)
+        return engine
+    
+    @property
+    def weights(self) -> Dict[str, float]:
+        return self._weights
+    
+    @weights.setter
+    def weights(self, weights: Dict[str, float]):
+        # Scoring reads only the tuple, so it is built before either is bound
+        weight_vec = tuple(weights.get(k, 0.0) for k in self.COMPONENTS)
+        self._weights = weights
+        self._weight_vec = weight_vec
+    
     def _load_weights(self, weights_path: Optional[Path]) -> Dict[str, float]:
         """Load weights from config file or use defaults."""
         if weights_path and weights_path.exists():
             try:
-                with open(weights_path, 'r') as f:
-                    config = yaml.safe_load(f)
-                    return config.get('weights', self.DEFAULT_WEIGHTS)
+                weights = _read_weights_file(str(weights_path), weights_path.stat().st_mtime_ns)
+                # Copy: the cached dict is shared by every engine loading this file
+                return dict(weights) if weights is not None else self._default_weights()
             except Exception as e:
                 print(f"Warning: Could not load weights from {weights_path}: {e}")
-                return self.DEFAULT_WEIGHTS
-        return self.DEFAULT_WEIGHTS
+                return self._default_weights()
+        return self._default_weights()
+    
+    @classmethod
+    def _default_weights(cls) -> Dict[str, float]:
+        """Copy of DEFAULT_WEIGHTS, normalized once per class."""
+        if cls._default_normalized is None:
+            cls._default_normalized = cls._normalize_weights(dict(cls.DEFAULT_WEIGHTS))
+        return dict(cls._default_normalized)
     
     def _validate_weights(self):
         """Ensure weights sum to 1.0."""
-        total = sum(self.weights.values())
-        if abs(total - 1.0) > 0.001:
+        self.weights = self._normalize_weights(self.weights)
+    
+    @staticmethod
+    def _normalize_weights(weights: Dict[str, float]) -> Dict[str, float]:
+        """Return weights scaled to sum to 1.0."""
+        total = math.fsum(weights.values())
+        if not math.isclose(total, 1.0, abs_tol=0.001):
             print(f"Warning: Weights sum to {total}, normalizing...")
-            self.weights = {k: v / total for k, v in self.weights.items()}
+            return {k: v / total for k, v in weights.items()}
+        return weights
+    
+    def set_weights(self, weights: Dict[str, float]) -> Dict[str, float]:
+        """Swap in new weights without rebuilding the engine.
+        
+        The normalized dict is built first and then bound in one assignment,
+        so concurrent scoring sees either the old or the new weights.
+        """
+        self.weights = self._normalize_weights(dict(weights))
+        return self.weights
+    
+    def save_weights(self, weights_path: Path):
+        """Persist current weights to a YAML config file."""
+        weights = self.weights
+        tmp_path = weights_path.with_suffix(weights_path.suffix + '.tmp')
+        with self._save_lock:
+            with open(tmp_path, 'w') as f:
+                yaml.dump({'weights': weights}, f, Dumper=_YAML_DUMPER)
+            os.replace(tmp_path, weights_path)
+    
+    def summarize_signals(self, signals: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Aggregate everything the signal-driven components need in one pass."""
+        if not signals:
+            # Ideas without signals are common; skip the clock read and cutoff
+            return dict(_EMPTY_SUMMARY)
+        volume_sum = growth_sum = 0.0
+        volume_count = growth_count = show_hn_count = 0
+        has_recent = False
+        now = datetime.utcnow()
+        cutoff = (now - timedelta(days=7)).strftime('%Y-%m-%d')
+        
+        for s in signals:
+            bucket = _METRIC_BUCKET.get(s.get('metric_type'))
+            if bucket == _VOLUME:
+                volume_sum += s['metric_value']
+                volume_count += 1
+            elif bucket == _GROWTH:
+                growth_sum += s['metric_value']
+                growth_count += 1
+            if 'show_hn' in s.get('source', ''):
+                show_hn_count += 1
+            if not has_recent and s.get('data_date'):
+                has_recent = self._is_recent(s['data_date'], days=7, now=now, cutoff=cutoff)
+        
+        return {
+            'signal_count': len(signals),
+            'avg_volume': volume_sum / volume_count if volume_count else None,
+            'avg_growth': growth_sum / growth_count if growth_count else None,
+            'has_recent': has_recent,
+            'show_hn_count': show_hn_count
+        }
     
     def calculate_demand_strength(self, signals: List[Dict[str, Any]]) -> float:
         """Calculate demand strength from signals (0-100 scale)."""
-        if not signals:
+        return self._demand_strength(self.summarize_signals(signals))
+    
+    def _demand_strength(self, summary: Dict[str, Any]) -> float:
+        if not summary['signal_count']:
             return 0.0
         
         # Aggregate all volume/count metrics
-        volume_metrics = [
-            s['metric_value'] for s in signals 
-            if s['metric_type'] in ['volume', 'post_count', 'story_count', 'video_count', 'interest_score']
-        ]
-        
-        if not volume_metrics:
+        avg_volume = summary['avg_volume']
+        if avg_volume is None:
             return 50.0  # Neutral if no volume data
         
         # Normalize: log scale to handle large ranges, cap at 100
-        import math
-        avg_volume = sum(volume_metrics) / len(volume_metrics)
         score = min(100, math.log1p(avg_volume) * 10)
         
         return score
     
     def calculate_demand_velocity(self, signals: List[Dict[str, Any]]) -> float:
         """Calculate demand velocity/trend (0-100 scale)."""
-        if not signals:
+        return self._demand_velocity(self.summarize_signals(signals))
+    
+    def _demand_velocity(self, summary: Dict[str, Any]) -> float:
+        if not summary['signal_count']:
             return 50.0
         
         # Look for growth_rate metrics
-        growth_signals = [
-            s['metric_value'] for s in signals 
-            if s['metric_type'] in ['growth_rate', 'trend_slope']
-        ]
-        
-        if growth_signals:
-            avg_growth = sum(growth_signals) / len(growth_signals)
+        avg_growth = summary['avg_growth']
+        if avg_growth is not None:
             # Normalize: -100% to +100% growth maps to 0-100 score
             # 0% growth = 50, +100% = 100, -100% = 0
             score = 50 + (avg_growth / 2)
-            return max(0, min(100, score))
+            return _clamp100(score)
         
         # Fallback: use recency of signals
-        recent_signals = [
-            s for s in signals 
-            if s.get('data_date') and self._is_recent(s['data_date'], days=7)
-        ]
-        
-        if recent_signals:
+        if summary['has_recent']:
             return 70.0  # Recent activity = decent velocity
         
         return 50.0
     
     def calculate_competition_proxy(self, signals: List[Dict[str, Any]], 
-                                   idea: Dict[str, Any]) -> float:
-        """Estimate competition level (inverse: low competition = high score)."""
-        # High volume + high engagement = likely saturated
-        volume = self.calculate_demand_strength(signals)
+                                   idea: Dict[str, Any],
+                                   demand_strength: Optional[float] = None) -> float:
+        """Estimate competition level (inverse: low competition = high score).
         
+        Args:
+            demand_strength: Already-computed demand strength for these signals
+        """
+        summary = self.summarize_signals(signals)
+        if demand_strength is None:
+            demand_strength = self._demand_strength(summary)
+        return self._competition_proxy(summary, demand_strength)
+    
+    def _competition_proxy(self, summary: Dict[str, Any], volume: float) -> float:
+        # volume is the demand strength: high volume + engagement = likely saturated
         # Check for Show HN posts (product launches)
-        show_hn_count = len([s for s in signals if 'show_hn' in s.get('source', '')])
+        show_hn_count = summary['show_hn_count']
         
         if show_hn_count > 5:
             return 30.0  # Many existing products = high competition
@@ -132,14 +284,7 @@ class ScoringEngine:
     def calculate_feasibility(self, idea: Dict[str, Any]) -> float:
         """Estimate build feasibility (0-100 scale)."""
         ops_burden = idea.get('ops_burden_estimate', 'medium').lower()
-        
-        burden_scores = {
-            'low': 85.0,
-            'medium': 65.0,
-            'high': 40.0
-        }
-        
-        base_score = burden_scores.get(ops_burden, 65.0)
+        base_score = self._FEASIBILITY_BY_BURDEN.get(ops_burden, 65.0)
         
         # Bonus for clear distribution channel
         if idea.get('distribution_channel'):
@@ -149,20 +294,12 @@ class ScoringEngine:
         if idea.get('compliance_risks'):
             base_score -= 15
         
-        return max(0, min(100, base_score))
+        return _clamp100(base_score)
     
     def calculate_automation_friendly(self, idea: Dict[str, Any]) -> float:
         """Estimate automation potential (0-100 scale)."""
         ops_burden = idea.get('ops_burden_estimate', 'medium').lower()
-        
-        # Low ops burden = more automatable
-        burden_scores = {
-            'low': 90.0,
-            'medium': 60.0,
-            'high': 30.0
-        }
-        
-        return burden_scores.get(ops_burden, 60.0)
+        return self._AUTOMATION_BY_BURDEN.get(ops_burden, 60.0)
     
     def calculate_monetization_clarity(self, idea: Dict[str, Any]) -> float:
         """Estimate monetization potential (0-100 scale)."""
@@ -182,26 +319,53 @@ class ScoringEngine:
         
         return min(100, score)
     
+    def score_signals(self, signals: List[Dict[str, Any]]) -> tuple:
+        """Calculate the signal-driven components for a set of signals.
+        
+        Returns:
+            (demand_strength, demand_velocity, competition_proxy)
+        """
+        summary = self.summarize_signals(signals)
+        demand_strength = self._demand_strength(summary)
+        return (
+            demand_strength,
+            self._demand_velocity(summary),
+            self._competition_proxy(summary, demand_strength)
+        )
+    
     def score_idea(self, idea: Dict[str, Any], 
-                   signals: List[Dict[str, Any]]) -> ScoreBreakdown:
-        """Calculate full score breakdown for a business idea."""
+                   signals: List[Dict[str, Any]],
+                   signal_scores: Optional[tuple] = None,
+                   weight_vec: Optional[tuple] = None) -> ScoreBreakdown:
+        """Calculate full score breakdown for a business idea.
+        
+        Args:
+            signal_scores: Precomputed score_signals(signals) result, to skip
+                re-aggregating signals shared by several ideas
+            weight_vec: Weights snapshot (in COMPONENTS order) to use instead
+                of the current weights
+        """
         
         # Calculate each component
-        demand_strength = self.calculate_demand_strength(signals)
-        demand_velocity = self.calculate_demand_velocity(signals)
-        competition_proxy = self.calculate_competition_proxy(signals, idea)
+        demand_strength, demand_velocity, competition_proxy = (
+            signal_scores or self.score_signals(signals)
+        )
         feasibility = self.calculate_feasibility(idea)
         automation_friendly = self.calculate_automation_friendly(idea)
         monetization_clarity = self.calculate_monetization_clarity(idea)
         
-        # Weighted total
+        # Weighted total (read weights once so a concurrent set_weights can't mix)
+        (w_demand_strength, w_demand_velocity, w_competition_proxy,
+         w_feasibility, w_automation_friendly, w_monetization_clarity) = (
+            weight_vec or self._weight_vec
+        )
         total = (
-            demand_strength * self.weights['demand_strength'] +
-            demand_velocity * self.weights['demand_velocity'] +
-            competition_proxy * self.weights['competition_proxy'] +
-            feasibility * self.weights['feasibility'] +
-            automation_friendly * self.weights['automation_friendly'] +
-            monetization_clarity * self.weights['monetization_clarity']
+            demand_strength * w_demand_strength +
+            demand_velocity * w_demand_velocity +
+            competition_proxy * w_competition_proxy +
+            feasibility * w_feasibility +
+            automation_friendly * w_automation_friendly +
+            monetization_clarity * w_monetization_clarity
         )
         
         return ScoreBreakdown(
@@ -221,19 +385,27 @@ class ScoringEngine:
             ideas_with_signals: List of (idea_dict, signals_list) tuples
             
         Returns:
-            List of ideas with score and rank added
+            The same idea dicts, updated in place with total_score,
+            score_breakdown and rank, sorted by rank
         """
         scored_ideas = []
+        # Ideas on the same topic share one signals list; aggregate it once
+        signal_scores_by_list = {}
+        # Score the whole batch against one weights snapshot
+        weight_vec = self._weight_vec
         
         for idea, signals in ideas_with_signals:
-            breakdown = self.score_idea(idea, signals)
-            idea_with_score = dict(idea)
-            idea_with_score['total_score'] = breakdown.total
-            idea_with_score['score_breakdown'] = breakdown.to_dict()
-            scored_ideas.append(idea_with_score)
+            signal_scores = signal_scores_by_list.get(id(signals))
+            if signal_scores is None:
+                signal_scores = self.score_signals(signals)
+                signal_scores_by_list[id(signals)] = signal_scores
+            breakdown = self.score_idea(idea, signals, signal_scores, weight_vec)
+            idea['total_score'] = breakdown.total
+            idea['score_breakdown'] = breakdown.to_dict()
+            scored_ideas.append(idea)
         
         # Sort by total score descending
-        scored_ideas.sort(key=lambda x: x['total_score'], reverse=True)
+        scored_ideas.sort(key=itemgetter('total_score'), reverse=True)
         
         # Add rank
         for i, idea in enumerate(scored_ideas, 1):
@@ -241,14 +413,22 @@ class ScoringEngine:
         
         return scored_ideas
     
-    def _is_recent(self, date_str: str, days: int = 7) -> bool:
-        """Check if a date string is within N days."""
-        from datetime import datetime, timedelta
-        try:
-            date = datetime.strptime(date_str, '%Y-%m-%d')
-            return datetime.utcnow() - date < timedelta(days=days)
-        except:
+    def _is_recent(self, date_str: str, days: int = 7,
+                   now: Optional[datetime] = None,
+                   cutoff: Optional[str] = None) -> bool:
+        """Check if a date string is within N days.
+        
+        cutoff is (now - days) as YYYY-MM-DD; pass it in when checking many dates."""
+        now = now or datetime.utcnow()
+        if isinstance(date_str, str) and _ISO_DATE_RE.fullmatch(date_str):
+            # Midnight of date_str is within N days of now iff its day is after the cutoff day
+            if cutoff is None:
+                cutoff = (now - timedelta(days=days)).strftime('%Y-%m-%d')
+            return date_str > cutoff
+        date = _parse_date(date_str)
+        if date is None:
             return False
+        return now - date < timedelta(days=days)
     
     def get_weights_config(self) -> Dict[str, Any]:
         """Get current weights configuration."""
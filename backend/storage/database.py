@@ -1,9 +1,14 @@
 """Database connection and operations."""
 import sqlite3
+import json
 import os
+import struct
+import threading
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 from contextlib import contextmanager
+from itertools import groupby
+from operator import itemgetter
 
 # Database path
 DB_PATH = Path(__file__).parent / "data.db"
@@ -17,191 +22,391 @@ def init_db():
         migrations = f.read()
     
     with get_db() as db:
+        # WAL lets readers proceed during writes; the setting persists in the file
+        db.execute("PRAGMA journal_mode=WAL")
         db.executescript(migrations)
+        # Columns added after release; ADD COLUMN has no IF NOT EXISTS
+        idea_columns = {row[1] for row in db.execute("PRAGMA table_info(business_ideas)")}
+        if 'score_blob' not in idea_columns:
+            db.execute("ALTER TABLE business_ideas ADD COLUMN score_blob BLOB")
         db.commit()
     
     print(f"✓ Database initialized at {DB_PATH}")
 
-@contextmanager
-def get_db():
-    """Get database connection."""
+# One connection per thread, reused across calls so sqlite3's per-connection
+# statement cache skips re-parsing the SQL of repeated queries
+_local = threading.local()
+
+def _connect() -> sqlite3.Connection:
     conn = sqlite3.connect(DB_PATH)
     conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA synchronous=NORMAL")  # Safe with WAL, far fewer fsyncs
+    conn.execute("PRAGMA temp_store=MEMORY")
+    return conn
+
+@contextmanager
+def get_db():
+    """Get this thread's database connection."""
+    conn = getattr(_local, 'conn', None)
+    if conn is None or _local.path != DB_PATH:
+        if conn is not None:
+            conn.close()
+        conn = _local.conn = _connect()
+        _local.path = DB_PATH
     try:
         yield conn
     finally:
-        conn.close()
+        # Don't leave a half-finished transaction on the shared connection
+        if conn.in_transaction and not getattr(_local, 'batched', False):
+            conn.rollback()
+
+def _commit(conn: sqlite3.Connection):
+    """Commit, unless an enclosing transaction() will commit instead."""
+    if not getattr(_local, 'batched', False):
+        conn.commit()
+
+@contextmanager
+def transaction():
+    """Run several storage calls as one all-or-nothing commit.
+    
+    Uses this thread's connection, so don't await inside the block: other
+    requests on the event loop thread would join the transaction."""
+    outer = getattr(_local, 'batched', False)
+    with get_db() as conn:
+        _local.batched = True
+        try:
+            yield conn
+            if not outer:
+                conn.commit()
+        finally:
+            _local.batched = outer
 
 # Conversation operations
+# Statements are module constants (one string object per query, so sqlite3's
+# statement cache always hits) with explicit columns instead of SELECT *
+_CONVERSATION_COLUMNS = "id, created_at, source_type, raw_text_hash, raw_summary"
+
+_INSERT_CONVERSATION_SQL = (
+    "INSERT INTO conversations (source_type, raw_text_hash, raw_summary) VALUES (?, ?, ?)"
+)
+_CONVERSATION_BY_ID_SQL = f"SELECT {_CONVERSATION_COLUMNS} FROM conversations WHERE id = ?"
+_LIST_CONVERSATIONS_SQL = (
+    f"SELECT {_CONVERSATION_COLUMNS} FROM conversations ORDER BY created_at DESC LIMIT ?"
+)
+
 def create_conversation(source_type: str, raw_text_hash: str, raw_summary: str) -> int:
     with get_db() as db:
         cursor = db.execute(
-            """INSERT INTO conversations (source_type, raw_text_hash, raw_summary)
-               VALUES (?, ?, ?)""",
-            (source_type, raw_text_hash, raw_summary)
+            _INSERT_CONVERSATION_SQL, (source_type, raw_text_hash, raw_summary)
         )
-        db.commit()
+        _commit(db)
         return cursor.lastrowid
 
 def get_conversation(conv_id: int) -> Optional[Dict[str, Any]]:
     with get_db() as db:
-        row = db.execute(
-            "SELECT * FROM conversations WHERE id = ?",
-            (conv_id,)
-        ).fetchone()
+        row = db.execute(_CONVERSATION_BY_ID_SQL, (conv_id,)).fetchone()
         return dict(row) if row else None
 
 def list_conversations(limit: int = 50) -> List[Dict[str, Any]]:
     with get_db() as db:
-        rows = db.execute(
-            "SELECT * FROM conversations ORDER BY created_at DESC LIMIT ?",
-            (limit,)
-        ).fetchall()
-        return [dict(row) for row in rows]
+        return list(map(dict, db.execute(_LIST_CONVERSATIONS_SQL, (limit,))))
 
 # Message operations
+_MESSAGE_COLUMNS = "id, conversation_id, text, speaker, timestamp"
+
+_INSERT_MESSAGE_SQL = "INSERT INTO messages (conversation_id, text, speaker) VALUES (?, ?, ?)"
+_MESSAGES_BY_CONVERSATION_SQL = (
+    f"SELECT {_MESSAGE_COLUMNS} FROM messages WHERE conversation_id = ? ORDER BY timestamp"
+)
+
 def create_message(conversation_id: int, text: str, speaker: Optional[str] = None) -> int:
     with get_db() as db:
-        cursor = db.execute(
-            """INSERT INTO messages (conversation_id, text, speaker)
-               VALUES (?, ?, ?)""",
-            (conversation_id, text, speaker)
-        )
-        db.commit()
+        cursor = db.execute(_INSERT_MESSAGE_SQL, (conversation_id, text, speaker))
+        _commit(db)
         return cursor.lastrowid
 
+def create_messages_bulk(conversation_id: int, rows: List[tuple]) -> int:
+    """Insert many messages in one transaction.
+    
+    Args:
+        rows: (text, speaker) tuples
+    
+    Returns:
+        Number of rows inserted
+    """
+    if not rows:
+        return 0
+    with get_db() as db:
+        db.executemany(
+            _INSERT_MESSAGE_SQL,
+            [(conversation_id, text, speaker) for text, speaker in rows]
+        )
+        _commit(db)
+        return len(rows)
+
 def get_messages_by_conversation(conv_id: int) -> List[Dict[str, Any]]:
     with get_db() as db:
-        rows = db.execute(
-            "SELECT * FROM messages WHERE conversation_id = ? ORDER BY timestamp",
-            (conv_id,)
-        ).fetchall()
-        return [dict(row) for row in rows]
+        return list(map(dict, db.execute(_MESSAGES_BY_CONVERSATION_SQL, (conv_id,))))
 
 # Topic operations
+# Topic keywords are stored as unit-separator-joined text: a flat list of short
+# strings doesn't need a JSON round trip on every write and read. Non-empty
+# lists start with the separator, so they can't be mistaken for the JSON text
+# of rows written before this format (or for an empty list)
+KEYWORD_SEP = '\x1f'
+
+def _encode_keywords(keywords: Optional[List[str]]) -> str:
+    if not keywords:
+        return ''
+    for keyword in keywords:
+        if KEYWORD_SEP in keyword:
+            raise ValueError(f"Keyword contains the reserved separator: {keyword!r}")
+    return KEYWORD_SEP + KEYWORD_SEP.join(keywords)
+
+def _decode_keywords(text: Optional[str]) -> List[str]:
+    if not text:
+        return []
+    if text[0] == KEYWORD_SEP:
+        return text[1:].split(KEYWORD_SEP)
+    return json.loads(text)  # Rows written before the delimited format
+
+_TOPIC_COLUMNS = "id, conversation_id, name, description, message_count, keywords, created_at"
+
+_INSERT_TOPIC_SQL = (
+    "INSERT INTO topics (conversation_id, name, description, keywords) VALUES (?, ?, ?, ?)"
+)
+_TOPICS_BY_CONVERSATION_SQL = (
+    f"SELECT {_TOPIC_COLUMNS} FROM topics WHERE conversation_id = ? ORDER BY message_count DESC"
+)
+_UPDATE_TOPIC_COUNT_SQL = "UPDATE topics SET message_count = ? WHERE id = ?"
+
 def create_topic(conversation_id: int, name: str, description: str = "", 
                  keywords: Optional[List[str]] = None) -> int:
-    import json
     with get_db() as db:
         cursor = db.execute(
-            """INSERT INTO topics (conversation_id, name, description, keywords)
-               VALUES (?, ?, ?, ?)""",
-            (conversation_id, name, description, json.dumps(keywords or []))
+            _INSERT_TOPIC_SQL,
+            (conversation_id, name, description, _encode_keywords(keywords))
         )
-        db.commit()
+        _commit(db)
         return cursor.lastrowid
 
 def get_topics_by_conversation(conv_id: int) -> List[Dict[str, Any]]:
-    import json
     with get_db() as db:
-        rows = db.execute(
-            "SELECT * FROM topics WHERE conversation_id = ? ORDER BY message_count DESC",
-            (conv_id,)
-        ).fetchall()
         result = []
-        for row in rows:
+        for row in db.execute(_TOPICS_BY_CONVERSATION_SQL, (conv_id,)):
             d = dict(row)
-            d['keywords'] = json.loads(d.get('keywords', '[]'))
+            d['keywords'] = _decode_keywords(d['keywords'])
             result.append(d)
         return result
 
 def update_topic_message_count(topic_id: int, count: int):
     with get_db() as db:
-        db.execute(
-            "UPDATE topics SET message_count = ? WHERE id = ?",
-            (count, topic_id)
-        )
-        db.commit()
+        db.execute(_UPDATE_TOPIC_COUNT_SQL, (count, topic_id))
+        _commit(db)
 
 # Pain point operations
+_PAIN_POINT_COLUMNS = "id, topic_id, statement, frequency, severity_score, evidence_quote"
+
+_INSERT_PAIN_POINT_SQL = (
+    "INSERT INTO pain_points (topic_id, statement, severity_score, evidence_quote) "
+    "VALUES (?, ?, ?, ?)"
+)
+_PAIN_POINTS_BY_TOPIC_SQL = (
+    f"SELECT {_PAIN_POINT_COLUMNS} FROM pain_points WHERE topic_id = ? "
+    "ORDER BY severity_score DESC, frequency DESC"
+)
+
 def create_pain_point(topic_id: int, statement: str, severity_score: float = 0.5,
                       evidence_quote: str = "") -> int:
     with get_db() as db:
         cursor = db.execute(
-            """INSERT INTO pain_points (topic_id, statement, severity_score, evidence_quote)
-               VALUES (?, ?, ?, ?)""",
+            _INSERT_PAIN_POINT_SQL,
             (topic_id, statement, severity_score, evidence_quote)
         )
-        db.commit()
+        _commit(db)
         return cursor.lastrowid
 
 def get_pain_points_by_topic(topic_id: int) -> List[Dict[str, Any]]:
     with get_db() as db:
-        rows = db.execute(
-            """SELECT * FROM pain_points 
-               WHERE topic_id = ? 
-               ORDER BY severity_score DESC, frequency DESC""",
-            (topic_id,)
-        ).fetchall()
-        return [dict(row) for row in rows]
+        return list(map(dict, db.execute(_PAIN_POINTS_BY_TOPIC_SQL, (topic_id,))))
 
 # Demand signal operations
+_DEMAND_SIGNAL_COLUMNS = (
+    "id, topic_id, source, query, metric_type, metric_value, metric_unit, url, "
+    "timestamp, data_date"
+)
+
+_INSERT_DEMAND_SIGNAL_SQL = (
+    "INSERT INTO demand_signals "
+    "(topic_id, source, query, metric_type, metric_value, metric_unit, url) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+_DEMAND_SIGNALS_BY_TOPIC_SQL = (
+    f"SELECT {_DEMAND_SIGNAL_COLUMNS} FROM demand_signals WHERE topic_id = ? "
+    "ORDER BY timestamp DESC"
+)
+_DEMAND_SIGNALS_VERSION_SQL = (
+    "SELECT COUNT(*), COALESCE(MAX(id), 0) FROM demand_signals WHERE topic_id = ?"
+)
+_DEMAND_SIGNALS_STATS_SQL = """SELECT 
+                COUNT(*) as total_signals,
+                COUNT(DISTINCT source) as sources,
+                AVG(metric_value) as avg_value,
+                MAX(timestamp) as latest_signal
+               FROM demand_signals 
+               WHERE topic_id = ?"""
+
 def create_demand_signal(topic_id: int, source: str, query: str, 
                         metric_type: str, metric_value: float,
                         metric_unit: str, url: str) -> int:
     with get_db() as db:
         cursor = db.execute(
-            """INSERT INTO demand_signals 
-               (topic_id, source, query, metric_type, metric_value, metric_unit, url)
-               VALUES (?, ?, ?, ?, ?, ?, ?)""",
+            _INSERT_DEMAND_SIGNAL_SQL,
             (topic_id, source, query, metric_type, metric_value, metric_unit, url)
         )
-        db.commit()
+        _commit(db)
         return cursor.lastrowid
 
+def create_demand_signals_bulk(topic_id: int, rows: List[tuple]) -> int:
+    """Insert many demand signals in one transaction.
+    
+    Args:
+        rows: (source, query, metric_type, metric_value, metric_unit, url) tuples
+    
+    Returns:
+        Number of rows inserted
+    """
+    if not rows:
+        return 0
+    with get_db() as db:
+        db.executemany(
+            _INSERT_DEMAND_SIGNAL_SQL,
+            [(topic_id, *row) for row in rows]
+        )
+        _commit(db)
+        return len(rows)
+
 def get_demand_signals_by_topic(topic_id: int) -> List[Dict[str, Any]]:
+    with get_db() as db:
+        return list(map(dict, db.execute(_DEMAND_SIGNALS_BY_TOPIC_SQL, (topic_id,))))
+
+def get_demand_signals_by_topics(topic_ids: List[int]) -> Dict[int, List[Dict[str, Any]]]:
+    """Fetch signals for several topics in one query, grouped by topic_id.
+    
+    Every requested topic gets an entry, empty if it has no signals."""
+    topic_ids = list(dict.fromkeys(topic_ids))
+    result = {tid: [] for tid in topic_ids}
+    if not topic_ids:
+        return result
+    
+    placeholders = ', '.join('?' for _ in topic_ids)
     with get_db() as db:
         rows = db.execute(
-            "SELECT * FROM demand_signals WHERE topic_id = ? ORDER BY timestamp DESC",
-            (topic_id,)
-        ).fetchall()
-        return [dict(row) for row in rows]
+            f"""SELECT {_DEMAND_SIGNAL_COLUMNS} FROM demand_signals WHERE topic_id IN ({placeholders})
+                ORDER BY topic_id, timestamp DESC""",
+            topic_ids
+        )
+        for topic_id, group in groupby(rows, key=itemgetter('topic_id')):
+            result[topic_id] = list(map(dict, group))
+    return result
+
+def get_demand_signals_version(topic_id: int) -> str:
+    """Cheap fingerprint of a topic's signals, for cache validation.
+    
+    Signals are insert-only, so (count, max id) changes whenever a row is added."""
+    with get_db() as db:
+        row = db.execute(_DEMAND_SIGNALS_VERSION_SQL, (topic_id,)).fetchone()
+        return f"{row[0]}-{row[1]}"
 
 def get_demand_signals_stats(topic_id: int) -> Dict[str, Any]:
     """Get aggregated stats for demand signals on a topic."""
     with get_db() as db:
-        row = db.execute(
-            """SELECT 
-                COUNT(*) as total_signals,
-                COUNT(DISTINCT source) as sources,
-                AVG(metric_value) as avg_value,
-                MAX(timestamp) as latest_signal
-               FROM demand_signals 
-               WHERE topic_id = ?""",
-            (topic_id,)
-        ).fetchone()
+        row = db.execute(_DEMAND_SIGNALS_STATS_SQL, (topic_id,)).fetchone()
         return dict(row) if row else {}
 
 # Business idea operations
+# Every plain insertable business_ideas column; missing optional values go in
+# as NULL. A score_breakdown dict is packed into score_blob (see _idea_values)
+IDEA_COLUMNS = ('topic_id', 'title', 'target_user', 'value_prop', 'why_now',
+                'pricing_model', 'distribution_channel', 'moat',
+                'ops_burden_estimate', 'compliance_risks', 'total_score', 'rank')
+
+# A missing total_score keeps the column default (0.0) rather than NULL
+_INSERT_IDEA_SQL = (
+    f"INSERT INTO business_ideas ({', '.join(IDEA_COLUMNS)}, score_blob) "
+    f"VALUES ({', '.join('COALESCE(?, 0.0)' if c == 'total_score' else '?' for c in IDEA_COLUMNS)}, ?)"
+)
+_IDEA_SELECT_SQL = (
+    f"SELECT id, {', '.join(IDEA_COLUMNS)}, score_breakdown, created_at, score_blob "
+    "FROM business_ideas"
+)
+_IDEA_BY_ID_SQL = _IDEA_SELECT_SQL + " WHERE id = ?"
+_UPDATE_IDEA_SCORE_SQL = (
+    "UPDATE business_ideas SET total_score = ?, score_blob = ?, score_breakdown = NULL "
+    "WHERE id = ?"
+)
+
+# Score breakdowns are always these seven floats (ScoreBreakdown field order,
+# i.e. scoring.engine.COMPONENTS + ('total',); tests check the two match),
+# so they're stored as a packed BLOB instead of JSON text
+SCORE_KEYS = ('demand_strength', 'demand_velocity', 'competition_proxy',
+              'feasibility', 'automation_friendly', 'monetization_clarity', 'total')
+_SCORE_STRUCT = struct.Struct('<7d')
+
+def _pack_scores(score_breakdown: Dict[str, float]) -> bytes:
+    return _SCORE_STRUCT.pack(*[score_breakdown[k] for k in SCORE_KEYS])
+
+def _idea_from_row(row: sqlite3.Row) -> Dict[str, Any]:
+    """Row -> API dict, with score_breakdown decoded from whichever column holds it."""
+    d = dict(row)
+    blob = d.pop('score_blob')
+    if blob:
+        d['score_breakdown'] = dict(zip(SCORE_KEYS, _SCORE_STRUCT.unpack(blob)))
+    elif d['score_breakdown']:
+        d['score_breakdown'] = json.loads(d['score_breakdown'])  # Rows scored before the BLOB
+    return d
+
+def _idea_values(idea: Dict[str, Any]) -> List[Any]:
+    """_INSERT_IDEA_SQL parameters for an idea dict."""
+    values = [idea.get(c) for c in IDEA_COLUMNS]
+    score_breakdown = idea.get('score_breakdown')
+    values.append(_pack_scores(score_breakdown) if score_breakdown else None)
+    return values
+
 def create_business_idea(topic_id: int, title: str, target_user: str, 
                         value_prop: str, **kwargs) -> int:
-    fields = ['topic_id', 'title', 'target_user', 'value_prop']
-    values = [topic_id, title, target_user, value_prop]
+    values = _idea_values(dict(kwargs, topic_id=topic_id, title=title,
+                               target_user=target_user, value_prop=value_prop))
     
-    optional_fields = ['why_now', 'pricing_model', 'distribution_channel', 
-                       'moat', 'ops_burden_estimate', 'compliance_risks',
-                       'total_score', 'score_breakdown', 'rank']
-    
-    for field in optional_fields:
-        if field in kwargs and kwargs[field] is not None:
-            fields.append(field)
-            values.append(kwargs[field])
+    with get_db() as db:
+        cursor = db.execute(_INSERT_IDEA_SQL, values)
+        _commit(db)
+        return cursor.lastrowid
+
+def create_business_ideas_bulk(ideas: List[Dict[str, Any]]) -> List[int]:
+    """Insert many business ideas in one transaction.
     
-    placeholders = ', '.join(['?' for _ in values])
-    field_names = ', '.join(fields)
+    Args:
+        ideas: Dicts keyed by IDEA_COLUMNS (topic_id, title, target_user and
+            value_prop required), plus an optional score_breakdown dict
     
+    Returns:
+        New idea ids, in input order
+    """
+    if not ideas:
+        return []
     with get_db() as db:
-        cursor = db.execute(
-            f"INSERT INTO business_ideas ({field_names}) VALUES ({placeholders})",
-            values
-        )
-        db.commit()
-        return cursor.lastrowid
+        # execute() per row (same cached statement) so each lastrowid is known
+        ids = [
+            db.execute(_INSERT_IDEA_SQL, _idea_values(idea)).lastrowid
+            for idea in ideas
+        ]
+        _commit(db)
+        return ids
 
 def get_business_ideas(topic_id: Optional[int] = None, 
                        min_score: float = 0.0) -> List[Dict[str, Any]]:
-    import json
-    query = "SELECT * FROM business_ideas WHERE total_score >= ?"
+    query = _IDEA_SELECT_SQL + " WHERE total_score >= ?"
     params = [min_score]
     
     if topic_id:
@@ -211,49 +416,82 @@ def get_business_ideas(topic_id: Optional[int] = None,
     query += " ORDER BY total_score DESC, rank ASC"
     
     with get_db() as db:
-        rows = db.execute(query, params).fetchall()
-        result = []
-        for row in rows:
-            d = dict(row)
-            if d.get('score_breakdown'):
-                d['score_breakdown'] = json.loads(d['score_breakdown'])
-            result.append(d)
-        return result
+        return list(map(_idea_from_row, db.execute(query, params)))
+
+def get_idea_by_id(idea_id: int) -> Optional[Dict[str, Any]]:
+    with get_db() as db:
+        row = db.execute(_IDEA_BY_ID_SQL, (idea_id,)).fetchone()
+        return _idea_from_row(row) if row else None
 
-def update_idea_score(idea_id: int, total_score: float, score_breakdown: str):
+def update_idea_score(idea_id: int, total_score: float, score_breakdown: Dict[str, float]):
     with get_db() as db:
         db.execute(
-            """UPDATE business_ideas 
-               SET total_score = ?, score_breakdown = ? 
-               WHERE id = ?""",
-            (total_score, score_breakdown, idea_id)
+            _UPDATE_IDEA_SCORE_SQL,
+            (total_score, _pack_scores(score_breakdown), idea_id)
         )
-        db.commit()
+        _commit(db)
+
+def update_idea_scores_bulk(rows: List[tuple]):
+    """Update many idea scores in one transaction.
+    
+    Args:
+        rows: (idea_id, total_score, score_breakdown dict) tuples
+    """
+    if not rows:
+        return
+    with get_db() as db:
+        db.executemany(
+            _UPDATE_IDEA_SCORE_SQL,
+            [(total_score, _pack_scores(score_breakdown), idea_id)
+             for idea_id, total_score, score_breakdown in rows]
+        )
+        _commit(db)
 
 # Evidence link operations
+_EVIDENCE_COLUMNS = "id, idea_id, url, title, snippet, source, relevance_score"
+
+_INSERT_EVIDENCE_SQL = (
+    "INSERT INTO evidence_links (idea_id, url, title, snippet, source, relevance_score) "
+    "VALUES (?, ?, ?, ?, ?, ?)"
+)
+_EVIDENCE_BY_IDEA_SQL = (
+    f"SELECT {_EVIDENCE_COLUMNS} FROM evidence_links WHERE idea_id = ? "
+    "ORDER BY relevance_score DESC LIMIT ?"
+)
+
 def create_evidence_link(idea_id: int, url: str, title: str = "", 
                         snippet: str = "", source: str = "", 
                         relevance_score: float = 0.5) -> int:
     with get_db() as db:
         cursor = db.execute(
-            """INSERT INTO evidence_links 
-               (idea_id, url, title, snippet, source, relevance_score)
-               VALUES (?, ?, ?, ?, ?, ?)""",
+            _INSERT_EVIDENCE_SQL,
             (idea_id, url, title, snippet, source, relevance_score)
         )
-        db.commit()
+        _commit(db)
         return cursor.lastrowid
 
+def create_evidence_links_bulk(idea_id: int, rows: List[tuple]) -> int:
+    """Insert many evidence links for one idea in one transaction.
+    
+    Args:
+        rows: (url, title, snippet, source, relevance_score) tuples
+    
+    Returns:
+        Number of rows inserted
+    """
+    if not rows:
+        return 0
+    with get_db() as db:
+        db.executemany(
+            _INSERT_EVIDENCE_SQL,
+            [(idea_id, *row) for row in rows]
+        )
+        _commit(db)
+        return len(rows)
+
 def get_evidence_by_idea(idea_id: int, limit: int = 10) -> List[Dict[str, Any]]:
     with get_db() as db:
-        rows = db.execute(
-            """SELECT * FROM evidence_links 
-               WHERE idea_id = ? 
-               ORDER BY relevance_score DESC 
-               LIMIT ?""",
-            (idea_id, limit)
-        ).fetchall()
-        return [dict(row) for row in rows]
+        return list(map(dict, db.execute(_EVIDENCE_BY_IDEA_SQL, (idea_id, limit))))
 
 if __name__ == "__main__":
     init_db()
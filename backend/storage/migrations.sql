@@ -21,7 +21,7 @@ CREATE TABLE IF NOT EXISTS topics (
     name TEXT NOT NULL,
     description TEXT,
     message_count INTEGER DEFAULT 0,
-    keywords TEXT, -- JSON array
+    keywords TEXT, -- Keywords joined with \x1f (older rows: JSON array)
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     FOREIGN KEY (conversation_id) REFERENCES conversations(id)
 );
@@ -63,7 +63,7 @@ CREATE TABLE IF NOT EXISTS business_ideas (
     ops_burden_estimate TEXT, -- 'low', 'medium', 'high'
     compliance_risks TEXT,
     total_score REAL DEFAULT 0.0,
-    score_breakdown TEXT, -- JSON
+    score_breakdown TEXT, -- JSON; legacy, new scores go in score_blob (added by init_db)
     rank INTEGER,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     FOREIGN KEY (topic_id) REFERENCES topics(id)
@@ -81,10 +81,21 @@ CREATE TABLE IF NOT EXISTS evidence_links (
 );
 
 -- Indexes for performance
-CREATE INDEX IF NOT EXISTS idx_messages_conversation ON messages(conversation_id);
-CREATE INDEX IF NOT EXISTS idx_topics_conversation ON topics(conversation_id);
-CREATE INDEX IF NOT EXISTS idx_pain_points_topic ON pain_points(topic_id);
-CREATE INDEX IF NOT EXISTS idx_demand_signals_topic ON demand_signals(topic_id);
+-- Foreign key + ORDER BY column(s), so per-parent listings come back
+-- pre-sorted from the index instead of a temp B-tree sort
+CREATE INDEX IF NOT EXISTS idx_conversations_created ON conversations(created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_messages_conversation_ts ON messages(conversation_id, timestamp);
+CREATE INDEX IF NOT EXISTS idx_topics_conversation_count ON topics(conversation_id, message_count DESC);
+CREATE INDEX IF NOT EXISTS idx_pain_points_topic_severity ON pain_points(topic_id, severity_score DESC, frequency DESC);
+CREATE INDEX IF NOT EXISTS idx_demand_signals_topic_ts ON demand_signals(topic_id, timestamp DESC);
 CREATE INDEX IF NOT EXISTS idx_demand_signals_source ON demand_signals(source, query);
-CREATE INDEX IF NOT EXISTS idx_business_ideas_topic ON business_ideas(topic_id);
-CREATE INDEX IF NOT EXISTS idx_evidence_idea ON evidence_links(idea_id);
+CREATE INDEX IF NOT EXISTS idx_business_ideas_topic_score ON business_ideas(topic_id, total_score DESC, rank);
+CREATE INDEX IF NOT EXISTS idx_evidence_idea_relevance ON evidence_links(idea_id, relevance_score DESC);
+
+-- Superseded by the composite indexes above (same leading column)
+DROP INDEX IF EXISTS idx_messages_conversation;
+DROP INDEX IF EXISTS idx_topics_conversation;
+DROP INDEX IF EXISTS idx_pain_points_topic;
+DROP INDEX IF EXISTS idx_demand_signals_topic;
+DROP INDEX IF EXISTS idx_business_ideas_topic;
+DROP INDEX IF EXISTS idx_evidence_idea;
@@ -9,6 +9,7 @@ Run this after starting the backend server.
 import requests
 import json
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 API_BASE = "https://business-signal-analyzer.onrender.com/api"
 
@@ -17,6 +18,9 @@ def demo():
     print("BUSINESS SIGNAL ANALYZER - DEMO FLOW")
     print("=" * 60)
     
+    # One keep-alive connection for every call in the demo
+    session = requests.Session()
+    
     # Step 1: Ingest conversation
     print("\n📥 Step 1: Ingesting conversation...")
     conversation = """
@@ -39,7 +43,7 @@ Me: What about your competitors?
 User: They all have the same problem. I was talking to a guy at the Alberta Construction Association meeting - he said compliance paperwork is the #1 administrative headache for small GCs.
 """
     
-    response = requests.post(f"{API_BASE}/conversations", json={
+    response = session.post(f"{API_BASE}/conversations", json={
         "text": conversation,
         "source_type": "user_interview"
     })
@@ -76,22 +80,25 @@ User: They all have the same problem. I was talking to a guy at the Alberta Cons
         }
     ]
     
-    topic_ids = []
-    for topic in topics:
-        response = requests.post(f"{API_BASE}/topics", data=topic)
-        if response.status_code == 200:
-            topic_id = response.json()["id"]
-            topic_ids.append(topic_id)
-            print(f"  ✅ Topic: {topic['name']} (ID: {topic_id})")
+    # One request (and one transaction) for all topics
+    response = session.post(f"{API_BASE}/topics/batch", json={"topics": topics})
+    if response.status_code != 200:
+        print(f"❌ Error: {response.text}")
+        return
+    
+    topic_ids = response.json()["ids"]
+    for topic, topic_id in zip(topics, topic_ids):
+        print(f"  ✅ Topic: {topic['name']} (ID: {topic_id})")
     
     # Step 3: Collect demand signals
     print("\n📊 Step 3: Collecting demand signals...")
     
     for topic_id in topic_ids[:2]:  # First 2 topics
         queries = ["construction compliance software", "subcontractor management", "WCB tracking"]
-        response = requests.post(
+        response = session.post(
             f"{API_BASE}/demand/collect",
-            json={"topic_id": topic_id, "queries": queries}
+            params={"topic_id": topic_id},
+            json=queries
         )
         if response.status_code == 200:
             data = response.json()
@@ -151,27 +158,28 @@ User: They all have the same problem. I was talking to a guy at the Alberta Cons
         }
     ]
     
-    idea_ids = []
+    # One request (and one transaction) for all ideas
+    response = session.post(f"{API_BASE}/ideas/batch", json={"ideas": ideas})
+    if response.status_code != 200:
+        print(f"❌ Error: {response.text}")
+        return
+    
     for idea in ideas:
-        response = requests.post(f"{API_BASE}/ideas", json=idea)
-        if response.status_code == 200:
-            idea_id = response.json()["id"]
-            idea_ids.append(idea_id)
-            print(f"  ✅ Idea: {idea['title'][:50]}...")
+        print(f"  ✅ Idea: {idea['title'][:50]}...")
     
     # Step 5: Score and rank ideas
     print("\n📈 Step 5: Scoring and ranking ideas...")
     
-    # Score individual ideas
-    for idea_id in idea_ids:
-        response = requests.post(f"{API_BASE}/ideas/{idea_id}/score")
-        if response.status_code == 200:
-            score = response.json()["total"]
-            print(f"  ✅ Idea {idea_id}: Score {score:.1f}/100")
+    # Ranking scores every idea of a topic server-side in one call per topic;
+    # topics are independent, so rank them concurrently
+    ranked_topics = sorted({idea["topic_id"] for idea in ideas})
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        responses = list(pool.map(
+            lambda topic_id: session.post(f"{API_BASE}/ideas/rank", params={"topic_id": topic_id}),
+            ranked_topics
+        ))
     
-    # Rank all ideas
-    for topic_id in topic_ids[:2]:
-        response = requests.post(f"{API_BASE}/ideas/rank", json={"topic_id": topic_id})
+    for topic_id, response in zip(ranked_topics, responses):
         if response.status_code == 200:
             ranked = response.json()
             print(f"\n  📊 Topic {topic_id} Rankings:")
@@ -182,7 +190,7 @@ User: They all have the same problem. I was talking to a guy at the Alberta Cons
     print("\n📋 Step 6: Evidence for top idea...")
     
     # Get top idea
-    response = requests.get(f"{API_BASE}/ideas?min_score=0")
+    response = session.get(f"{API_BASE}/ideas?min_score=0")
     if response.status_code == 200:
         ideas = response.json()
         if ideas:
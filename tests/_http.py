@@ -0,0 +1,42 @@
+"""
+Shared HTTP helpers for the audit and smoke scripts.
+Both target the same host, so one warm connection pool serves every check.
+"""
+import atexit
+import json
+import threading
+from typing import Any, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson  # Optional: faster JSON parsing
+except ImportError:
+    orjson = None
+
+_session: Optional[requests.Session] = None
+_lock = threading.Lock()
+
+def get_shared_session() -> requests.Session:
+    """Return the process-wide pooled session, creating it on first use."""
+    global _session
+    with _lock:
+        if _session is None:
+            session = requests.Session()
+            # pool_block caps in-flight requests at pool_maxsize per host across
+            # every user of the session, instead of opening throwaway extras
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=20, pool_block=True,
+                                  max_retries=Retry(total=2, backoff_factor=0.2))
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            atexit.register(session.close)
+            _session = session
+        return _session
+
+def json_loads(data: bytes) -> Any:
+    """Parse a JSON response body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -7,15 +7,36 @@ import requests
 import json
 import sys
 from urllib.parse import urljoin, urlparse
-from typing import List, Dict, Set, Tuple
+from typing import List, Dict, Set, Tuple, Optional
+from concurrent.futures import ThreadPoolExecutor
+from collections import Counter
 import re
 
+from _http import get_shared_session
+
+# 422 is OK for param-less GETs (validation error for missing params)
+_OK_GET_STATUS = frozenset({200, 422})
+
+_SEV_ORDER = {'CRITICAL': 0, 'HIGH': 1, 'MEDIUM': 2, 'LOW': 3}
+
+_HREF_RE = re.compile(r'''href=["']([^"']+)["']''')
+
+# GET bodies are streamed and read at most this far. Pages under the limit
+# are drained fully, so their connection still goes back to the pool.
+_BODY_LIMIT = 64 * 1024
+
+# Nav links are looked for up to the first </nav>, and never past this point
+_NAV_SCAN_LIMIT = 32 * 1024
+
 class AppAuditor:
-    def __init__(self, base_url: str = "https://business-signal-analyzer.onrender.com"):
+    def __init__(self, base_url: str = "https://business-signal-analyzer.onrender.com",
+                 session: Optional[requests.Session] = None):
         self.base_url = base_url.rstrip('/')
         self.frontend_routes = [
             '/', '/topics.html', '/ideas.html', '/evidence.html'
         ]
+        # Routes whose HTML content is validated; the rest only need 200 + text/html
+        self.body_checked_routes = {'/'}
         self.api_endpoints = [
             ('GET', '/api/health'),
             ('GET', '/api/conversations'),
@@ -30,156 +51,219 @@ class AppAuditor:
             ('GET', '/api/evidence/idea/{id}'),
         ]
         self.findings: List[Dict] = []
+        self.max_workers = 10  # Concurrent probes (kept under pool_maxsize)
+        
+        # Pooled session (shared with the smoke tests by default): every probe
+        # hits the same host, so reuse connections
+        self.session = session or get_shared_session()
+        # (response, body) by (method, url), so passes that share URLs fetch them once
+        self._resp_cache: Dict[Tuple[str, str], Tuple[requests.Response, str]] = {}
+        # Route path -> status code from the frontend pass, reused by link checks
+        self._probe_results: Dict[str, int] = {}
+    
+    def _probe_all(self, check, items) -> List[Dict]:
+        """Run check(item) for every item concurrently, keeping input order.
+        
+        Each check returns (result, finding or None); findings are recorded
+        here, on the calling thread, so their order is deterministic."""
+        if not items:
+            return []
+        results = []
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(items))) as pool:
+            for result, finding in pool.map(check, items):
+                results.append(result)
+                if finding:
+                    self.findings.append(finding)
+        return results
     
     def audit_frontend_routes(self) -> List[Dict]:
         """Check all frontend routes return valid HTML."""
         print("🔍 Auditing frontend routes...")
-        results = []
-        
-        for route in self.frontend_routes:
-            url = f"{self.base_url}{route}"
-            try:
-                resp = requests.get(url, timeout=30)
-                
-                # Check for valid HTML response
+        results = self._probe_all(self._check_route, self.frontend_routes)
+        self._probe_results.update((r['route'], r['code']) for r in results if 'code' in r)
+        return results
+    
+    def _fetch(self, method: str, url: str, **kwargs) -> Tuple[requests.Response, str]:
+        """Request a URL once per audit run; returns the response and its body
+        text, decoded from at most _BODY_LIMIT bytes."""
+        key = (method, url)
+        cached = self._resp_cache.get(key)
+        if cached is None:
+            resp = self.session.request(method, url, stream=True, **kwargs)
+            chunks, size = [], 0
+            if method != 'HEAD':
+                for chunk in resp.iter_content(8192):
+                    chunks.append(chunk)
+                    size += len(chunk)
+                    if size >= _BODY_LIMIT:
+                        break
+            resp.close()
+            body = b''.join(chunks).decode(resp.encoding or 'utf-8', errors='ignore')
+            cached = self._resp_cache[key] = (resp, body)
+        return cached
+    
+    def _head_or_get(self, url: str, timeout: float) -> requests.Response:
+        """HEAD a URL, falling back to GET if the server won't answer HEAD usefully."""
+        resp, _ = self._fetch('HEAD', url, timeout=timeout, allow_redirects=True)
+        if resp.status_code == 405 or 'content-type' not in resp.headers:
+            resp, _ = self._fetch('GET', url, timeout=timeout)
+        return resp
+    
+    def _check_route(self, route: str) -> Tuple[Dict, Optional[Dict]]:
+        url = f"{self.base_url}{route}"
+        try:
+            if route not in self.body_checked_routes:
+                # Liveness only: headers are enough, skip downloading the page
+                resp = self._head_or_get(url, timeout=30)
                 is_html = 'text/html' in resp.headers.get('content-type', '')
-                has_body = '<body>' in resp.text.lower() or '<!doctype' in resp.text.lower()
-                is_blank = len(resp.text.strip()) < 100
-                
-                if resp.status_code == 200 and is_html and has_body and not is_blank:
-                    results.append({
-                        'route': route,
-                        'status': 'PASS',
-                        'code': resp.status_code,
-                        'size': len(resp.text)
-                    })
-                else:
-                    results.append({
-                        'route': route,
-                        'status': 'FAIL',
-                        'code': resp.status_code,
-                        'html': is_html,
-                        'has_body': has_body,
-                        'is_blank': is_blank,
-                        'size': len(resp.text)
-                    })
-                    self.findings.append({
-                        'severity': 'HIGH' if route == '/' else 'MEDIUM',
-                        'type': 'frontend_route',
-                        'route': route,
-                        'issue': f"Status {resp.status_code}, HTML: {is_html}, Has body: {has_body}, Blank: {is_blank}"
-                    })
-            except Exception as e:
-                results.append({
+                size = int(resp.headers.get('content-length', 0))
+                if resp.status_code == 200 and is_html:
+                    return {'route': route, 'status': 'PASS', 'code': resp.status_code, 'size': size}, None
+                return {
                     'route': route,
-                    'status': 'ERROR',
-                    'error': str(e)
-                })
-                self.findings.append({
-                    'severity': 'CRITICAL',
+                    'status': 'FAIL',
+                    'code': resp.status_code,
+                    'html': is_html,
+                    'size': size
+                }, {
+                    'severity': 'MEDIUM',
                     'type': 'frontend_route',
                     'route': route,
-                    'issue': f"Exception: {str(e)}"
-                })
-        
-        return results
+                    'issue': f"Status {resp.status_code}, HTML: {is_html}"
+                }
+            
+            resp, body = self._fetch('GET', url, timeout=30)
+            size = int(resp.headers.get('content-length', len(body)))
+            
+            # Check for valid HTML response
+            is_html = 'text/html' in resp.headers.get('content-type', '')
+            lowered = body.lower()
+            has_body = '<body>' in lowered or '<!doctype' in lowered
+            is_blank = len(body.strip()) < 100
+            
+            if resp.status_code == 200 and is_html and has_body and not is_blank:
+                return {
+                    'route': route,
+                    'status': 'PASS',
+                    'code': resp.status_code,
+                    'size': size
+                }, None
+            return {
+                'route': route,
+                'status': 'FAIL',
+                'code': resp.status_code,
+                'html': is_html,
+                'has_body': has_body,
+                'is_blank': is_blank,
+                'size': size
+            }, {
+                'severity': 'HIGH' if route == '/' else 'MEDIUM',
+                'type': 'frontend_route',
+                'route': route,
+                'issue': f"Status {resp.status_code}, HTML: {is_html}, Has body: {has_body}, Blank: {is_blank}"
+            }
+        except Exception as e:
+            return {
+                'route': route,
+                'status': 'ERROR',
+                'error': str(e)
+            }, {
+                'severity': 'CRITICAL',
+                'type': 'frontend_route',
+                'route': route,
+                'issue': f"Exception: {str(e)}"
+            }
     
     def audit_api_endpoints(self) -> List[Dict]:
         """Check all API endpoints respond correctly."""
         print("🔍 Auditing API endpoints...")
-        results = []
         
-        # Health check
-        try:
-            resp = requests.get(f"{self.base_url}/api/health", timeout=10)
-            if resp.status_code == 200 and 'healthy' in resp.text:
-                results.append({'endpoint': '/api/health', 'status': 'PASS', 'code': 200})
-            else:
-                results.append({'endpoint': '/api/health', 'status': 'FAIL', 'code': resp.status_code})
-                self.findings.append({
-                    'severity': 'CRITICAL',
-                    'type': 'api',
-                    'endpoint': '/api/health',
-                    'issue': f"Health check failed: {resp.status_code}"
-                })
-        except Exception as e:
-            results.append({'endpoint': '/api/health', 'status': 'ERROR', 'error': str(e)})
-            self.findings.append({
-                'severity': 'CRITICAL',
-                'type': 'api',
-                'endpoint': '/api/health',
-                'issue': f"Health check exception: {str(e)}"
-            })
-        
-        # Test GET endpoints that don't require params
+        # Health check, then GET endpoints that don't require params
         get_endpoints = [
+            '/api/health',
             '/api/conversations',
             '/api/topics',
             '/api/ideas',
             '/api/scoring/weights',
         ]
-        
-        for endpoint in get_endpoints:
+        return self._probe_all(self._check_endpoint, get_endpoints)
+    
+    def _check_endpoint(self, endpoint: str) -> Tuple[Dict, Optional[Dict]]:
+        if endpoint == '/api/health':
             try:
-                resp = requests.get(f"{self.base_url}{endpoint}", timeout=10)
-                if resp.status_code in [200, 422]:  # 422 is OK (validation error for missing params)
-                    results.append({'endpoint': endpoint, 'status': 'PASS', 'code': resp.status_code})
-                else:
-                    results.append({'endpoint': endpoint, 'status': 'WARN', 'code': resp.status_code})
-                    self.findings.append({
-                        'severity': 'MEDIUM',
-                        'type': 'api',
-                        'endpoint': endpoint,
-                        'issue': f"Unexpected status: {resp.status_code}"
-                    })
+                resp = self.session.get(f"{self.base_url}/api/health", timeout=10)
+                if resp.status_code == 200 and 'healthy' in resp.text:
+                    return {'endpoint': '/api/health', 'status': 'PASS', 'code': 200}, None
+                return {'endpoint': '/api/health', 'status': 'FAIL', 'code': resp.status_code}, {
+                    'severity': 'CRITICAL',
+                    'type': 'api',
+                    'endpoint': '/api/health',
+                    'issue': f"Health check failed: {resp.status_code}"
+                }
             except Exception as e:
-                results.append({'endpoint': endpoint, 'status': 'ERROR', 'error': str(e)})
-                self.findings.append({
-                    'severity': 'HIGH',
+                return {'endpoint': '/api/health', 'status': 'ERROR', 'error': str(e)}, {
+                    'severity': 'CRITICAL',
                     'type': 'api',
-                    'endpoint': endpoint,
-                    'issue': f"Exception: {str(e)}"
-                })
+                    'endpoint': '/api/health',
+                    'issue': f"Health check exception: {str(e)}"
+                }
         
-        return results
+        try:
+            resp = self.session.get(f"{self.base_url}{endpoint}", timeout=10)
+            if resp.status_code in _OK_GET_STATUS:
+                return {'endpoint': endpoint, 'status': 'PASS', 'code': resp.status_code}, None
+            return {'endpoint': endpoint, 'status': 'WARN', 'code': resp.status_code}, {
+                'severity': 'MEDIUM',
+                'type': 'api',
+                'endpoint': endpoint,
+                'issue': f"Unexpected status: {resp.status_code}"
+            }
+        except Exception as e:
+            return {'endpoint': endpoint, 'status': 'ERROR', 'error': str(e)}, {
+                'severity': 'HIGH',
+                'type': 'api',
+                'endpoint': endpoint,
+                'issue': f"Exception: {str(e)}"
+            }
     
     def check_navigation_links(self) -> List[Dict]:
         """Check all nav links in HTML point to valid routes."""
         print("🔍 Checking navigation links...")
-        results = []
         
         try:
-            resp = requests.get(f"{self.base_url}/", timeout=10)
-            html = resp.text
+            # Usually already fetched by audit_frontend_routes
+            resp, html = self._fetch('GET', f"{self.base_url}/", timeout=10)
             
-            # Find all href links
-            links = re.findall(r'href=["\']([^"\']+)["\']', html)
+            # Find href links in the navigation region at the top of the page
+            region = html[:_NAV_SCAN_LIMIT]
+            nav_end = region.find('</nav>')
+            if nav_end != -1:
+                region = region[:nav_end + len('</nav>')]
+            links = _HREF_RE.findall(region)
             internal_links = [l for l in links if not l.startswith('http') and not l.startswith('#')]
             
-            for link in set(internal_links):
-                if link.startswith('/'):
-                    full_url = f"{self.base_url}{link}"
-                else:
-                    full_url = f"{self.base_url}/{link}"
-                
-                try:
-                    link_resp = requests.head(full_url, timeout=5, allow_redirects=True)
-                    if link_resp.status_code < 400:
-                        results.append({'link': link, 'status': 'PASS', 'code': link_resp.status_code})
-                    else:
-                        results.append({'link': link, 'status': 'FAIL', 'code': link_resp.status_code})
-                        self.findings.append({
-                            'severity': 'MEDIUM',
-                            'type': 'navigation',
-                            'link': link,
-                            'issue': f"Broken link, status: {link_resp.status_code}"
-                        })
-                except Exception as e:
-                    results.append({'link': link, 'status': 'ERROR', 'error': str(e)})
+            return self._probe_all(self._check_link, list(dict.fromkeys(internal_links)))
         except Exception as e:
-            results.append({'error': str(e)})
+            return [{'error': str(e)}]
+    
+    def _check_link(self, link: str) -> Tuple[Dict, Optional[Dict]]:
+        path = link if link.startswith('/') else f"/{link}"
         
-        return results
+        try:
+            # Routes the frontend pass already probed keep that status
+            code = self._probe_results.get(path)
+            if code is None:
+                code = self._head_or_get(f"{self.base_url}{path}", timeout=5).status_code
+            if code < 400:
+                return {'link': link, 'status': 'PASS', 'code': code}, None
+            return {'link': link, 'status': 'FAIL', 'code': code}, {
+                'severity': 'MEDIUM',
+                'type': 'navigation',
+                'link': link,
+                'issue': f"Broken link, status: {code}"
+            }
+        except Exception as e:
+            return {'link': link, 'status': 'ERROR', 'error': str(e)}, None
     
     def run_full_audit(self) -> Dict:
         """Run complete audit and return report."""
@@ -189,10 +273,15 @@ class AppAuditor:
         print(f"Target: {self.base_url}")
         print()
         
-        frontend = self.audit_frontend_routes()
-        api = self.audit_api_endpoints()
-        nav = self.check_navigation_links()
+        try:
+            frontend = self.audit_frontend_routes()
+            api = self.audit_api_endpoints()
+            nav = self.check_navigation_links()
+        finally:
+            self._resp_cache.clear()
+            self._probe_results.clear()
         
+        sev_counts = Counter(f['severity'] for f in self.findings)
         report = {
             'timestamp': str(datetime.now()),
             'base_url': self.base_url,
@@ -201,14 +290,14 @@ class AppAuditor:
                 'api_endpoints_checked': len(api),
                 'nav_links_checked': len(nav),
                 'total_findings': len(self.findings),
-                'critical': len([f for f in self.findings if f['severity'] == 'CRITICAL']),
-                'high': len([f for f in self.findings if f['severity'] == 'HIGH']),
-                'medium': len([f for f in self.findings if f['severity'] == 'MEDIUM']),
+                'critical': sev_counts['CRITICAL'],
+                'high': sev_counts['HIGH'],
+                'medium': sev_counts['MEDIUM'],
             },
             'frontend_results': frontend,
             'api_results': api,
             'navigation_results': nav,
-            'findings': sorted(self.findings, key=lambda x: {'CRITICAL': 0, 'HIGH': 1, 'MEDIUM': 2, 'LOW': 3}[x['severity']])
+            'findings': sorted(self.findings, key=lambda f: _SEV_ORDER[f['severity']])
         }
         
         self.print_report(report)
@@ -253,5 +342,5 @@ if __name__ == "__main__":
     report = auditor.run_full_audit()
     
     # Exit with error code if critical findings
-    critical_count = len([f for f in report['findings'] if f['severity'] == 'CRITICAL'])
+    critical_count = report['summary']['critical']
     sys.exit(1 if critical_count > 0 else 0)
@@ -6,20 +6,52 @@ Uses requests + BeautifulSoup to verify UI structure without browser automation.
 import requests
 from bs4 import BeautifulSoup
 import re
-from typing import List, Dict
+from typing import List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+
+from _http import get_shared_session, json_loads
+
+try:
+    import lxml  # Optional: C-backed parser for BeautifulSoup
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+def find_first(soup: BeautifulSoup, selectors: List[str]) -> Dict:
+    """First element matching each '#id', '.class' or tag selector, in one tree walk."""
+    wanted = set(selectors)
+    ids = {sel[1:] for sel in wanted if sel.startswith('#')}
+    classes = {sel[1:] for sel in wanted if sel.startswith('.')}
+    found = {}
+    for tag in soup.find_all(True):
+        if tag.name in wanted:
+            found.setdefault(tag.name, tag)
+        if tag.get('id') in ids:
+            found.setdefault('#' + tag['id'], tag)
+        for cls in tag.get('class', ()):
+            if cls in classes:
+                found.setdefault('.' + cls, tag)
+        if len(found) == len(wanted):
+            break
+    return found
 
 class UISmokeTester:
-    def __init__(self, base_url: str = "https://business-signal-analyzer.onrender.com"):
+    def __init__(self, base_url: str = "https://business-signal-analyzer.onrender.com",
+                 session: Optional[requests.Session] = None):
         self.base_url = base_url.rstrip('/')
         self.results: List[Dict] = []
+        # Pooled session (shared with the auditor by default): every request
+        # goes to the same host
+        self.session = session or get_shared_session()
     
     def test_page_structure(self, route: str, expected_elements: List[Dict]) -> Dict:
         """Test a page loads and has expected elements."""
         url = f"{self.base_url}{route}"
         
         try:
-            resp = requests.get(url, timeout=30)
-            soup = BeautifulSoup(resp.text, 'html.parser')
+            resp = self.session.get(url, timeout=30)
+            soup = BeautifulSoup(resp.text, HTML_PARSER)
+            matches = find_first(soup, [e.get('selector') for e in expected_elements])
             
             findings = []
             all_pass = True
@@ -29,13 +61,7 @@ class UISmokeTester:
                 text_contains = element.get('text_contains')
                 required = element.get('required', True)
                 
-                if selector.startswith('#'):
-                    found = soup.find(id=selector[1:])
-                elif selector.startswith('.'):
-                    found = soup.find(class_=selector[1:])
-                else:
-                    found = soup.find(selector)
-                
+                found = matches.get(selector)
                 if found:
                     text_match = True
                     if text_contains:
@@ -125,8 +151,13 @@ class UISmokeTester:
             }
         ]
         
-        for test in tests:
-            result = self.test_page_structure(test['route'], test['elements'])
+        # Pages are independent: fetch and check them concurrently, report in order
+        with ThreadPoolExecutor(max_workers=len(tests)) as pool:
+            results = list(pool.map(
+                lambda test: self.test_page_structure(test['route'], test['elements']), tests
+            ))
+        
+        for test, result in zip(tests, results):
             self.results.append(result)
             icon = '✅' if result['status'] == 'PASS' else '❌'
             print(f"  {icon} {test['route']}: {result['status']}")
@@ -143,7 +174,7 @@ Me: How do you currently track them?
 User: Just spreadsheets. It's a mess."""
         
         try:
-            resp = requests.post(
+            resp = self.session.post(
                 f"{self.base_url}/api/conversations",
                 json={'text': conversation_text, 'source_type': 'test'},
                 timeout=10
@@ -152,24 +183,31 @@ User: Just spreadsheets. It's a mess."""
             if resp.status_code != 200:
                 return {'status': 'FAIL', 'step': 'create_conversation', 'error': resp.text}
             
-            conv_data = resp.json()
+            conv_data = json_loads(resp.content)
             conv_id = conv_data.get('id')
             
             print(f"  ✅ Created conversation #{conv_id}")
             
+            # Steps 2 and 3 only depend on step 1, so issue them together
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                topics_future = pool.submit(
+                    self.session.get, f"{self.base_url}/api/topics?conversation_id={conv_id}", timeout=10
+                )
+                ideas_future = pool.submit(self.session.get, f"{self.base_url}/api/ideas", timeout=10)
+            
             # Step 2: Get topics
-            resp = requests.get(f"{self.base_url}/api/topics?conversation_id={conv_id}", timeout=10)
+            resp = topics_future.result()
             if resp.status_code != 200:
                 return {'status': 'FAIL', 'step': 'get_topics', 'error': resp.text}
             
             print(f"  ✅ Retrieved topics")
             
             # Step 3: Get ideas
-            resp = requests.get(f"{self.base_url}/api/ideas", timeout=10)
+            resp = ideas_future.result()
             if resp.status_code != 200:
                 return {'status': 'FAIL', 'step': 'get_ideas', 'error': resp.text}
             
-            ideas = resp.json()
+            ideas = json_loads(resp.content)
             print(f"  ✅ Retrieved {len(ideas)} ideas")
             
             return {
@@ -1,7 +1,16 @@
 """Tests for demand signal connectors."""
+import json
+import pickle
+import sys
+import threading
+import time
+import types
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from backend.connectors.base import DemandSignal, BaseConnector
+from backend.connectors.base import (
+    DemandSignal, DemandSignalBatch, BaseConnector, MetricType, TTLCache, TokenBucket
+)
 from backend.connectors.google_trends import GoogleTrendsConnector
 from backend.connectors.reddit import RedditConnector
 from backend.connectors.hackernews import HackerNewsConnector
@@ -37,78 +46,167 @@ class TestDemandSignal:
         assert d['source'] == "test"
         assert d['metric_value'] == 100.0
         assert 'timestamp' in d
+    
+    def test_to_json(self):
+        signal = DemandSignal(
+            source="test",
+            query="example",
+            metric_type="volume",
+            metric_value=100.0,
+            metric_unit="mentions",
+            url="https://example.com"
+        )
+        assert json.loads(signal.to_json()) == signal.to_dict()
+    
+    def test_pickle_roundtrip(self):
+        signal = DemandSignal(
+            source="test",
+            query="example",
+            metric_type="volume",
+            metric_value=100.0,
+            metric_unit="mentions",
+            url="https://example.com"
+        )
+        restored = pickle.loads(pickle.dumps(signal))
+        assert restored.to_dict() == signal.to_dict()
+    
+    def test_metric_type_serializes_as_string(self):
+        signal = DemandSignal(
+            source="test",
+            query="example",
+            metric_type=MetricType.POST_COUNT,
+            metric_value=100.0,
+            metric_unit="posts",
+            url="https://example.com"
+        )
+        assert signal.metric_type == "post_count"
+        assert type(signal.metric_type) is str
+        assert f"{signal.metric_type}" == "post_count"
+        assert DemandSignalBatch.from_signals([signal]).metric_types == ["post_count"]
+        assert json.loads(signal.to_json())["metric_type"] == "post_count"
+
+
+class TestDemandSignalBatch:
+    """Test columnar DemandSignalBatch."""
+    
+    def test_from_signals(self):
+        signals = [
+            DemandSignal("test", "a", "volume", 1.0, "mentions", "https://example.com/a"),
+            DemandSignal("test", "b", "volume", 2.0, "mentions", "https://example.com/b"),
+        ]
+        batch = DemandSignalBatch.from_signals(signals)
+        assert len(batch) == 2
+        
+        columns = batch.to_dict_of_lists()
+        assert columns['query'] == ["a", "b"]
+        assert columns['metric_value'] == [1.0, 2.0]
+        assert columns['data_date'] == [s.data_date for s in signals]
+
+
+class TestTTLCache:
+    """Test the connector response cache."""
+    
+    def test_lru_eviction(self):
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')  # 'b' is now least recently used
+        cache.set('c', 3)
+        assert cache.get('b') is None
+        assert cache.get('a') == 1
+        assert cache.get('c') == 3
+    
+    def test_expiry(self):
+        cache = TTLCache(maxsize=2, ttl=-1)
+        cache.set('a', 1)
+        assert cache.get('a') is None
+
+
+class TestTokenBucket:
+    """Test the connector rate limiter."""
+    
+    def test_burst_then_wait(self):
+        bucket = TokenBucket(rate=1.0, burst=2)
+        assert bucket.take() == 0.0
+        assert bucket.take() == 0.0
+        assert bucket.take() > 0.0
+
+
+@pytest.mark.parametrize("cls,name,count", [
+    (GoogleTrendsConnector, "google_trends", 1),
+    (RedditConnector, "reddit", 3),
+    (HackerNewsConnector, "hackernews", 3),
+    (YouTubeConnector, "youtube", 3),
+])
+def test_mock_search(cls, name, count):
+    """Each connector returns its mock signals, tagged with its source name."""
+    connector = cls(mock_mode=True)
+    assert connector.mock_mode is True
+    assert connector.source_name == name
+    signals = connector.search("test query")
+    assert len(signals) == count
+    assert all(s.source == name for s in signals)
 
 
 class TestGoogleTrendsConnector:
     """Test Google Trends connector."""
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def connector(self):
+        # Module scope: these tests only read the connector; tests that
+        # mutate one need a function-scoped fixture
         return GoogleTrendsConnector(mock_mode=True)
     
-    def test_mock_mode(self, connector):
-        assert connector.mock_mode is True
-        signals = connector.search("test query")
-        assert len(signals) == 1
-        assert signals[0].source == "google_trends"
-    
     def test_mock_signals_deterministic(self, connector):
         """Same query should generate same mock values."""
         signals1 = connector.search("python")
         signals2 = connector.search("python")
         assert signals1[0].metric_value == signals2[0].metric_value
-    
-    def test_source_name(self, connector):
-        assert connector.source_name == "google_trends"
 
 
 class TestRedditConnector:
     """Test Reddit connector."""
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def connector(self):
         return RedditConnector(mock_mode=True)
     
-    def test_mock_mode(self, connector):
-        signals = connector.search("startup")
-        assert len(signals) == 3
-        assert all(s.source == "reddit" for s in signals)
-    
     def test_problem_posts_mock(self, connector):
         posts = connector.get_problem_posts("startups")
         assert len(posts) > 0
         assert "title" in posts[0]
-
-
-class TestHackerNewsConnector:
-    """Test Hacker News connector."""
     
-    @pytest.fixture
-    def connector(self):
-        # HN doesn't need API keys
-        return HackerNewsConnector()
-    
-    def test_search_mock(self, connector):
-        connector.mock_mode = True
-        signals = connector.search("python")
-        assert len(signals) == 3
-        assert signals[0].source == "hackernews"
-    
-    def test_source_name(self, connector):
-        assert connector.source_name == "hackernews"
+    def test_client_per_thread(self, monkeypatch):
+        """Threads never share a praw.Reddit (it isn't thread-safe)."""
+        fake_praw = types.ModuleType('praw')
+        fake_praw.Reddit = lambda **kwargs: object()
+        monkeypatch.setitem(sys.modules, 'praw', fake_praw)
+        
+        connector = RedditConnector(client_id='id', client_secret='secret')
+        assert connector.client is connector.client
+        
+        barrier = threading.Barrier(4)  # Keep all four threads alive at once
+        
+        def client_in_thread(_):
+            barrier.wait()
+            return connector.client
+        
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            clients = list(pool.map(client_in_thread, range(4)))
+        assert len({id(c) for c in clients + [connector.client]}) == 5
 
 
 class TestYouTubeConnector:
     """Test YouTube connector."""
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def connector(self):
         return YouTubeConnector(mock_mode=True)
     
-    def test_mock_mode(self, connector):
-        signals = connector.search("tutorial")
-        assert len(signals) == 3
-        assert all(s.source == "youtube" for s in signals)
+    def test_search_many_mock(self, connector):
+        results = connector.search_many(["tutorial", "course"])
+        assert set(results) == {"tutorial", "course"}
+        assert all(len(signals) == 3 for signals in results.values())
     
     def test_no_api_key_fallback(self):
         """Should switch to mock mode without API key."""
@@ -136,9 +234,53 @@ class TestBaseConnector:
         assert len(signals) == 3
         assert all(isinstance(s, DemandSignal) for s in signals)
     
+    def test_mock_signals_memoized(self, connector):
+        first = connector._generate_mock_signals("test", count=3)
+        second = connector._generate_mock_signals("test", count=3)
+        assert [s.to_dict() for s in first] == [s.to_dict() for s in second]
+        
+        # Callers get their own objects: changing one doesn't reach the cache
+        first[0].metric_value = -1.0
+        assert all(a is not b for a, b in zip(first, second))
+        assert connector._generate_mock_signals("test", count=3)[0].metric_value > 0
+    
     def test_mock_signal_url(self, connector):
         signals = connector._generate_mock_signals("test")
         assert all(s.url.startswith("https://") for s in signals)
+    
+    def test_fan_out(self):
+        class FailingConnector(self.MockConnector):
+            @property
+            def source_name(self):
+                return "failing"
+            
+            def search(self, query, **kwargs):
+                raise RuntimeError("boom")
+        
+        results = BaseConnector.fan_out(
+            [self.MockConnector(mock_mode=True), FailingConnector(mock_mode=True)], "test"
+        )
+        assert len(results["mock"]) == 2
+        assert results["failing"] == []
+    
+    def test_session_created_once_concurrently(self, connector, monkeypatch):
+        """Threads racing on first use share one session."""
+        built = []
+        build = BaseConnector._build_session
+        
+        def slow_build():
+            time.sleep(0.01)  # Widen the race window
+            built.append(build())
+            return built[-1]
+        
+        monkeypatch.setattr(BaseConnector, '_build_session', staticmethod(slow_build))
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            sessions = list(pool.map(lambda _: connector.session, range(8)))
+        
+        assert len(built) == 1
+        assert all(s is built[0] for s in sessions)
+        connector.close()
+        assert connector._session is None
 
 
 if __name__ == "__main__":
@@ -0,0 +1,134 @@
+"""Tests for the SQLite storage layer."""
+import json
+import sqlite3
+import pytest
+from dataclasses import fields
+from pathlib import Path
+from backend.storage import database
+from backend.scoring.engine import COMPONENTS, ScoreBreakdown
+
+
+MIGRATIONS = Path(database.__file__).parent / "migrations.sql"
+
+BREAKDOWN = {
+    'demand_strength': 81.25,
+    'demand_velocity': 70.0,
+    'competition_proxy': 65.0,
+    'feasibility': 95.0,
+    'automation_friendly': 90.0,
+    'monetization_clarity': 100.0,
+    'total': 82.31
+}
+
+
+@pytest.fixture
+def db_path(tmp_path, monkeypatch):
+    """Point the storage layer at a fresh database file."""
+    path = tmp_path / "test.db"
+    monkeypatch.setattr(database, 'DB_PATH', path)
+    return path
+
+
+class TestScoreStorage:
+    """Test packed score breakdown storage."""
+    
+    def test_score_keys_match_engine(self):
+        assert database.SCORE_KEYS == COMPONENTS + ('total',)
+        assert database.SCORE_KEYS == tuple(f.name for f in fields(ScoreBreakdown))
+    
+    def test_pack_round_trip(self, db_path):
+        database.init_db()
+        idea_id = database.create_business_idea(
+            1, 'Test SaaS', 'Freelancers', 'Automate invoicing',
+            total_score=BREAKDOWN['total'], score_breakdown=BREAKDOWN
+        )
+        assert database.get_idea_by_id(idea_id)['score_breakdown'] == BREAKDOWN
+        
+        [bulk_id] = database.create_business_ideas_bulk([{
+            'topic_id': 1, 'title': 'Bulk', 'target_user': 'Teams',
+            'value_prop': 'Saves time', 'score_breakdown': BREAKDOWN
+        }])
+        assert database.get_idea_by_id(bulk_id)['score_breakdown'] == BREAKDOWN
+        
+        rescored = dict(BREAKDOWN, total=50.5)
+        database.update_idea_score(idea_id, 50.5, rescored)
+        assert database.get_idea_by_id(idea_id)['score_breakdown'] == rescored
+    
+    def test_unscored_idea_has_no_breakdown(self, db_path):
+        database.init_db()
+        idea_id = database.create_business_idea(1, 'Test SaaS', 'Freelancers', 'Automate invoicing')
+        assert database.get_idea_by_id(idea_id)['score_breakdown'] is None
+    
+    def test_legacy_json_row(self, db_path):
+        """Rows scored before score_blob existed still decode after init_db."""
+        conn = sqlite3.connect(db_path)
+        conn.executescript(MIGRATIONS.read_text())
+        conn.execute(
+            "INSERT INTO business_ideas (topic_id, title, target_user, value_prop, "
+            "total_score, score_breakdown) VALUES (1, 'Old', 'Anyone', 'Legacy', ?, ?)",
+            (BREAKDOWN['total'], json.dumps(BREAKDOWN))
+        )
+        conn.commit()
+        conn.close()
+        
+        database.init_db()
+        [idea] = database.get_business_ideas()
+        assert idea['score_breakdown'] == BREAKDOWN
+        assert 'score_blob' not in idea
+    
+    def test_init_db_rerun(self, db_path):
+        """init_db on an existing, already-migrated database keeps its data."""
+        database.init_db()
+        idea_id = database.create_business_idea(
+            1, 'Test SaaS', 'Freelancers', 'Automate invoicing', score_breakdown=BREAKDOWN
+        )
+        
+        database.init_db()
+        assert database.get_idea_by_id(idea_id)['score_breakdown'] == BREAKDOWN
+
+
+
+class TestKeywordStorage:
+    """Test delimited topic keyword storage."""
+    
+    @pytest.mark.parametrize("keywords", [
+        [],
+        ['invoicing'],
+        ['invoicing', 'freelancers', 'cash flow'],
+        [''],
+        ['', ''],
+        ['[]'],
+        ['["x"]'],
+        ['[1]'],
+    ])
+    def test_round_trip(self, keywords):
+        encoded = database._encode_keywords(keywords)
+        assert database._decode_keywords(encoded) == keywords
+    
+    def test_separator_rejected(self):
+        with pytest.raises(ValueError):
+            database._encode_keywords(['a' + database.KEYWORD_SEP + 'b'])
+    
+    def test_topic_round_trip(self, db_path):
+        database.init_db()
+        conv_id = database.create_conversation('test', 'hash', 'summary')
+        database.create_topic(conv_id, 'Invoicing', keywords=['[]', 'invoices'])
+        [topic] = database.get_topics_by_conversation(conv_id)
+        assert topic['keywords'] == ['[]', 'invoices']
+    
+    def test_legacy_json_row(self, db_path):
+        """Rows written as JSON before the delimited format still decode."""
+        database.init_db()
+        conv_id = database.create_conversation('test', 'hash', 'summary')
+        with database.get_db() as db:
+            db.execute(
+                "INSERT INTO topics (conversation_id, name, keywords) VALUES (?, ?, ?)",
+                (conv_id, 'Old', json.dumps(['invoicing', 'freelancers']))
+            )
+            db.commit()
+        [topic] = database.get_topics_by_conversation(conv_id)
+        assert topic['keywords'] == ['invoicing', 'freelancers']
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])